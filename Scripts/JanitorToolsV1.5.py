@@ -1,14 +1,330 @@
 import bpy
 import bmesh
+import collections
+import csv
+import functools
+import hashlib
 import math
-import radians, hypot
+import numpy as np
+#import radians, hypot
 import itertools
+import json
 import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from bpy.app.handlers import persistent
 from bpy.props import StringProperty
 from bpy_extras.io_utils import ExportHelper
+from mathutils import Matrix, Vector
 
 bl_info = {"name": "JanitorTools", "blender": (2, 8, 0), "category": "3D View"}
 
+
+# Ways OBJECT_OT_BatchExportFBX can split the selection into files
+EXPORT_GROUPINGS = [
+    ('NONE', "Single File", "Write the whole selection into one FBX"),
+    ('COLLECTION', "Collection", "Write one FBX per collection"),
+    ('PREFIX', "Name Prefix", "Write one FBX per name prefix (SM_Chair_01 -> SM_Chair)"),
+]
+
+
+# Ways OBJECT_OT_JoinMeshes can split the selection into separate joins
+JOIN_GROUPINGS = [
+    ('NONE', "All", "Join the whole selection into the first object"),
+    ('MATERIAL', "Material", "Join objects sharing the same first material"),
+    ('COLLECTION', "Collection", "Join objects per collection"),
+]
+
+
+# Bucket objects by export/join grouping, keeping the selection order inside each group
+def group_objects(objects, group_by):
+    groups = {}
+    for obj in objects:
+        if group_by == 'COLLECTION':
+            key = obj.users_collection[0].name if obj.users_collection else "Scene"
+        elif group_by == 'PREFIX':
+            key = "_".join(obj.name.split("_")[:2])
+        elif group_by == 'MATERIAL':
+            material = obj.material_slots[0].material if obj.material_slots else None
+            key = material.name if material else ""
+        else:
+            key = ""
+        groups.setdefault(key, []).append(obj)
+    return dict(sorted(groups.items()))
+
+
+# Swaps the view layer selection between export batches. Only what is selected right
+# now is deselected, so N batches cost O(N) instead of N select_all calls. Reading the
+# live selection also drops anything the artist picked while a modal job waited for its
+# next tick, so only `objects` reach the exporter or join.
+class _Selection:
+    def __init__(self, context):
+        self.view_layer = context.view_layer
+        self.saved = list(context.selected_objects)
+        self.saved_active = context.view_layer.objects.active
+
+    def select(self, objects):
+        for obj in bpy.context.selected_objects:
+            obj.select_set(False)
+        for obj in objects:
+            try:
+                obj.select_set(True)
+            except ReferenceError:
+                pass  # Deleted while a modal job was running
+        if objects:
+            self.view_layer.objects.active = objects[0]
+
+    def restore(self):
+        try:
+            self.select(self.saved)
+            self.view_layer.objects.active = self.saved_active
+        except ReferenceError:
+            pass
+
+
+# Bumped whenever a mesh's geometry is updated; a cheap change stamp for the per-mesh caches
+_mesh_generation = {}
+
+
+# Identity of a mesh datablock for the per-mesh caches. Names are reused after a rename
+# or delete; session_uid (Blender 2.91+) never is, older versions fall back to the pointer.
+def mesh_key(mesh):
+    return getattr(mesh, "session_uid", None) or mesh.as_pointer()
+
+
+def mesh_change_stamp(mesh):
+    return (_mesh_generation.get(mesh_key(mesh), 0), len(mesh.vertices), len(mesh.edges), len(mesh.loops), len(mesh.polygons))
+
+
+# Drop the cache entries of meshes that no longer exist
+def prune_mesh_caches():
+    live = {mesh_key(mesh) for mesh in bpy.data.meshes}
+    for cache in (_mesh_generation, _audit_cache, _topology_cache):
+        for key in [key for key in cache if key not in live]:
+            del cache[key]
+
+
+# What OBJECT_PT_ScaleDisplay shows for the active object, so draw() never has to
+# stringify transforms or evaluate the bounding box
+_panel_cache = {}
+
+# Redraw timing of OBJECT_PT_ScaleDisplay, collected while janitor_draw_timing is on
+_draw_stats = {"count": 0, "total": 0.0, "max": 0.0, "last": 0.0}
+
+
+def refresh_panel_cache(obj):
+    _panel_cache.clear()
+    _panel_cache["key"] = obj.name_full if obj else None
+    if obj is not None:
+        _panel_cache["name"] = obj.name
+        _panel_cache["scale"] = str(obj.scale)
+        _panel_cache["dimensions"] = str(obj.dimensions)
+        _panel_cache["materials"] = [slot.material.name if slot.material else None for slot in obj.material_slots]
+
+
+@persistent
+def _on_depsgraph_update(scene, depsgraph=None):
+    if depsgraph is None:
+        depsgraph = bpy.context.evaluated_depsgraph_get()
+    active = depsgraph.view_layer.objects.active
+    stale = (active.name_full if active else None) != _panel_cache.get("key")
+
+    for update in depsgraph.updates:
+        data = update.id.original
+        if active is not None and data in (active, active.data):
+            stale = True
+        # The cache holds material names, so any material change (a rename from this
+        # panel included) refreshes it before draw() looks a stale name up
+        if isinstance(data, bpy.types.Material):
+            stale = True
+        if not update.is_updated_geometry:
+            continue
+        if isinstance(data, bpy.types.Object):
+            data = data.data
+        if isinstance(data, bpy.types.Mesh):
+            key = mesh_key(data)
+            _mesh_generation[key] = _mesh_generation.get(key, 0) + 1
+
+    if stale:
+        refresh_panel_cache(active)
+
+
+@persistent
+def _on_load_post(*args):
+    _mesh_generation.clear()
+    _panel_cache.clear()
+    _audit_cache.clear()
+    _last_audit.clear()
+    _topology_cache.clear()
+
+
+# Rolling history of profiled operator runs, newest last
+_profile_history = collections.deque(maxlen=100)
+
+# Records of the profiled operators currently running (operators can call each other)
+_profile_stack = []
+
+
+def _count_op_call(idname):
+    for record in _profile_stack:
+        record["ops_calls"] += 1
+        if "mode_set" in idname:
+            record["mode_switches"] += 1
+
+
+# bpy.ops routes every call through a module level function (_op_call, or op_call
+# before Blender 2.90); wrap it while a profiled operator runs to count calls
+def _ops_hook(install):
+    ops_module = sys.modules.get("bpy.ops")
+    for attribute in ("_op_call", "op_call"):
+        original = getattr(ops_module, attribute, None)
+        if original is None:
+            continue
+        if install and not hasattr(original, "janitor_original"):
+            def counted(idname, *args, _original=original):
+                _count_op_call(str(idname))
+                return _original(idname, *args)
+            counted.janitor_original = original
+            setattr(ops_module, attribute, counted)
+        elif not install and hasattr(original, "janitor_original"):
+            setattr(ops_module, attribute, original.janitor_original)
+
+
+# Decorator for operator execute methods: records wall time, peak traced Python memory,
+# bpy.ops calls and mode switches of every run in _profile_history
+def profiled(execute):
+    @functools.wraps(execute)
+    def wrapper(self, context):
+        outermost = not _profile_stack
+        track_memory = context.window_manager.janitor_profile_memory
+        started_tracing = track_memory and not tracemalloc.is_tracing()
+        if outermost:
+            _ops_hook(True)
+        if started_tracing:
+            tracemalloc.start()
+        memory_start = tracemalloc.get_traced_memory()[0] if tracemalloc.is_tracing() else 0
+
+        record = {"operator": self.bl_idname, "ops_calls": 0, "mode_switches": 0, "peak_kib": None}
+        _profile_stack.append(record)
+        start = time.perf_counter()
+        result = None
+        try:
+            result = execute(self, context)
+            return result
+        finally:
+            record["seconds"] = time.perf_counter() - start
+            _profile_stack.pop()
+            if tracemalloc.is_tracing():
+                record["peak_kib"] = max(0, tracemalloc.get_traced_memory()[1] - memory_start) / 1024.0
+            if started_tracing:
+                tracemalloc.stop()
+            if outermost:
+                _ops_hook(False)
+            record["result"] = sorted(result) if result else ["ERROR"]
+            record["time"] = time.time()
+            # Jobs that went modal are recorded by JanitorJob when they end
+            if result != {'RUNNING_MODAL'}:
+                _profile_history.append(record)
+    return wrapper
+
+
+# Mixin for batch operators. execute() prepares a list of work items and returns
+# start_job(); the operator implements job_step(context, items) and
+# job_finish(context, cancelled). From the UI the items are processed chunk_size per
+# timer tick with a progress bar, and Esc cancels after the current chunk. In background
+# mode (CLI, workers) or with use_modal off, all chunks run right away through the same steps.
+class JanitorJob:
+    use_modal: bpy.props.BoolProperty(name="Show Progress", description="Run from a timer so the UI stays responsive; Esc cancels", default=True)
+    chunk_size: bpy.props.IntProperty(name="Items per Tick", description="Work items processed between UI updates", default=1, min=1)
+
+    def start_job(self, context, items):
+        self.job_items = list(items)
+        self.job_done = 0
+        self.job_start = time.perf_counter()
+        self.job_workers = None
+        if not self.use_modal or bpy.app.background or context.window is None:
+            while self.job_done < len(self.job_items):
+                if not self.job_next_chunk(context):
+                    return self.job_finish(context, True)
+            return self.job_finish(context, False)
+        return self.job_timer_start(context, 0.001)
+
+    # Background worker processes run under the same timer: every tick counts their
+    # log lines for progress and Esc terminates them. job_finish then finds
+    # (job, log entries, exit code, output path) per worker in self.job_results.
+    def start_worker_job(self, context, flag, jobs, total):
+        self.job_items = range(total)
+        self.job_done = 0
+        self.job_start = time.perf_counter()
+        self.job_workdir, self.job_workers = start_background_workers(flag, jobs)
+        if not self.use_modal or bpy.app.background or context.window is None:
+            while background_workers_running(self.job_workers):
+                time.sleep(0.25)
+            self.job_results = finish_background_workers(self.job_workers)
+            return self.job_finish(context, False)
+        return self.job_timer_start(context, 0.25)
+
+    def job_timer_start(self, context, interval):
+        wm = context.window_manager
+        self.job_timer = wm.event_timer_add(interval, window=context.window)
+        wm.progress_begin(0, len(self.job_items))
+        wm.modal_handler_add(self)
+        return {'RUNNING_MODAL'}
+
+    # False when job_step raised; the job is then cancelled so the timer, progress bar
+    # and job_finish cleanup (selection, open files) still run
+    def job_next_chunk(self, context):
+        chunk = self.job_items[self.job_done:self.job_done + self.chunk_size]
+        try:
+            self.job_step(context, chunk)
+        except Exception as error:
+            self.report({'ERROR'}, "{} failed: {}: {}".format(self.bl_label, type(error).__name__, error))
+            return False
+        self.job_done += len(chunk)
+        return True
+
+    def modal(self, context, event):
+        if event.type == 'ESC' and event.value == 'PRESS':
+            return self.end_job(context, True)
+        if event.type != 'TIMER':
+            return {'PASS_THROUGH'}
+
+        if self.job_workers is not None:
+            self.job_done = background_workers_progress(self.job_workers)
+            context.window_manager.progress_update(self.job_done)
+            if not background_workers_running(self.job_workers):
+                return self.end_job(context, False)
+            return {'RUNNING_MODAL'}
+
+        if not self.job_next_chunk(context):
+            return self.end_job(context, True)
+        context.window_manager.progress_update(self.job_done)
+        if self.job_done >= len(self.job_items):
+            return self.end_job(context, False)
+        return {'RUNNING_MODAL'}
+
+    def end_job(self, context, cancelled):
+        wm = context.window_manager
+        wm.event_timer_remove(self.job_timer)
+        wm.progress_end()
+        if self.job_workers is not None:
+            self.job_results = finish_background_workers(self.job_workers, terminate=cancelled)
+        if cancelled:
+            self.report({'WARNING'}, "Cancelled after {} of {} items".format(self.job_done, len(self.job_items)))
+
+        result = self.job_finish(context, cancelled)
+        _profile_history.append({
+            "operator": self.bl_idname, "ops_calls": None, "mode_switches": None, "peak_kib": None,
+            "seconds": time.perf_counter() - self.job_start, "result": sorted(result), "time": time.time(), "modal": True,
+        })
+        return result
+
+
 class OBJECT_PT_ScaleDisplay(bpy.types.Panel):
     bl_label = "JanitorTools"
     bl_idname = "PT_ScaleDisplay"
@@ -18,6 +334,8 @@ class OBJECT_PT_ScaleDisplay(bpy.types.Panel):
 
     def draw(self, context):
         layout = self.layout
+        timing = context.window_manager.janitor_draw_timing
+        start = time.perf_counter()
         
         
         row = layout.row()
@@ -44,8 +362,13 @@ class OBJECT_PT_ScaleDisplay(bpy.types.Panel):
         row.operator("object.add_material_slot", text="Add Material Slot")
         
 
+        row = layout.row()
+        row.operator("object.merge_duplicate_materials", text="Merge Duplicate Materials")
+        
+
         row = layout.row()
         row.operator("object.rename_selected", text="Rename Selected")
+        row.operator("object.fix_naming", text="Fix Names")
         
 
         row = layout.row()
@@ -54,6 +377,7 @@ class OBJECT_PT_ScaleDisplay(bpy.types.Panel):
         
         row = layout.row()
         row.operator("object.export_selected_objects", text="Batch Export FBX (Split)")
+        row.operator("object.generate_lods", text="Generate LODs")
         
 
         row = layout.row()
@@ -71,6 +395,10 @@ class OBJECT_PT_ScaleDisplay(bpy.types.Panel):
         
         row.operator("object.triangulate_faces", text="Triangulate NGONS")
         
+        row.operator("object.delete_ngons", text="Count NGONS").dry_run = True
+        
+        row.operator("object.cleanup_geometry", text="Cleanup Geometry")
+        
         
         row = layout.row()
         row.operator("object.inset_and_poke", text="Inset and Poke")
@@ -82,6 +410,10 @@ class OBJECT_PT_ScaleDisplay(bpy.types.Panel):
         row.operator("object.select_and_mark_seam", text="Seam Loop")
         
         row.operator("object.select_and_clear_seam", text="Clear Seam Loop")
+
+        row = layout.row()
+        row.operator("object.detect_feature_edges", text="Mark Feature Edges")
+        row.operator("object.detect_feature_edges", text="Count Feature Edges").dry_run = True
         
         
         #row = layout.row()
@@ -91,64 +423,108 @@ class OBJECT_PT_ScaleDisplay(bpy.types.Panel):
         
                 
 
+        # The cache is refreshed by the depsgraph handler; only an active object switch
+        # the handler has not seen yet is picked up here
         obj = context.active_object
+        if (obj.name_full if obj else None) != _panel_cache.get("key"):
+            refresh_panel_cache(obj)
+
         if obj is not None:
-            layout.label(text="Selected Object: " + obj.name)
-            layout.label(text="Scale: " + str(obj.scale))
-            layout.label(text="Dimensions: " + str(obj.dimensions))
+            layout.label(text="Selected Object: " + _panel_cache["name"])
+            layout.label(text="Scale: " + _panel_cache["scale"])
+            layout.label(text="Dimensions: " + _panel_cache["dimensions"])
 
-            material_slots = obj.material_slots
-            if material_slots:
+            material_names = _panel_cache["materials"]
+            if material_names:
                 layout.label(text="Materials:")
-                for index, material_slot in enumerate(material_slots):
+                for index, name in enumerate(material_names):
                     row = layout.row(align=True)
-                    if material_slot.material:
-                        row.prop(material_slot.material, "name", text="")  # Dropdown to select the material
+                    material = bpy.data.materials.get(name) if name else None
+                    if material:
+                        row.prop(material, "name", text="")  # Dropdown to select the material
                     else:
-                        row.label(text="Slot {}: None".format(index))
+                        row.label(text="Slot {}: {}".format(index, name))
         else:
             layout.label(text="No active object selected.")
 
+        layout.prop(context.window_manager, "janitor_draw_timing")
+        if timing:
+            elapsed = (time.perf_counter() - start) * 1000.0
+            _draw_stats["count"] += 1
+            _draw_stats["total"] += elapsed
+            _draw_stats["max"] = max(_draw_stats["max"], elapsed)
+            _draw_stats["last"] = elapsed
+            layout.label(text="Draw: {:.3f} ms (avg {:.3f}, max {:.3f}, {} redraws)".format(
+                elapsed, _draw_stats["total"] / _draw_stats["count"], _draw_stats["max"], _draw_stats["count"]))
+
+
+# Per-loop polygon index, derived from loop_start/loop_total without touching Python objects
+def loop_polygon_indices(mesh):
+    loop_starts = np.empty(len(mesh.polygons), np.int32)
+    loop_totals = np.empty(len(mesh.polygons), np.int32)
+    mesh.polygons.foreach_get("loop_start", loop_starts)
+    mesh.polygons.foreach_get("loop_total", loop_totals)
+    order = np.argsort(loop_starts, kind="stable")
+    return np.repeat(order, loop_totals[order])
+
+
+# Face-area weighted vertex normals computed from the polygon and loop arrays
+def face_area_vertex_normals(mesh):
+    normals = np.empty(len(mesh.polygons) * 3, np.float32)
+    areas = np.empty(len(mesh.polygons), np.float32)
+    loop_vertices = np.empty(len(mesh.loops), np.int32)
+    mesh.polygons.foreach_get("normal", normals)
+    mesh.polygons.foreach_get("area", areas)
+    mesh.loops.foreach_get("vertex_index", loop_vertices)
+
+    weighted = normals.reshape(-1, 3) * areas[:, None]
+    per_loop = weighted[loop_polygon_indices(mesh)]
+    vertex_normals = np.empty((len(mesh.vertices), 3), np.float64)
+    for axis in range(3):
+        vertex_normals[:, axis] = np.bincount(loop_vertices, weights=per_loop[:, axis], minlength=len(mesh.vertices))
+
+    lengths = np.linalg.norm(vertex_normals, axis=1)
+    lengths[lengths == 0.0] = 1.0
+    return vertex_normals / lengths[:, None]
+
 
 #SmoothWeights            
 class OBJECT_OT_SmoothWeightsOperator(bpy.types.Operator):
     bl_label = "Smooth Weights"
     bl_idname = "object.smooth_weights"
     
+    @profiled
     def execute(self,context):
-        # Get the active object
-        obj = bpy.context.active_object
+        # Every selected mesh (plus the active one), each mesh datablock once
+        objects = list(context.selected_objects)
+        if context.active_object and context.active_object not in objects:
+            objects.append(context.active_object)
+        meshes = {obj.data for obj in objects if obj.type == 'MESH'}
+
+        if not meshes:
+            self.report({'WARNING'}, "No mesh objects selected.")
+            return {'CANCELLED'}
 
-        # Check if there's an active object and if it's a mesh
-        if obj and obj.type == 'MESH':
-            # Shade smooth the active object
-            bpy.ops.object.shade_smooth()
+        # Mesh arrays are only current in Object Mode; one switch covers multi-object edit mode
+        if context.mode != 'OBJECT':
+            bpy.ops.object.mode_set(mode='OBJECT')
 
-            # Enable auto smooth (if not already enabled)
-            if not obj.data.use_auto_smooth:
-                obj.data.use_auto_smooth = True
-            
-            # Set the auto smooth angle to 30 degrees (optional)
-            obj.data.auto_smooth_angle = 30.0
+        vertex_count = 0
+        for mesh in meshes:
+            # Shade smooth and clear every sharp edge
+            mesh.polygons.foreach_set("use_smooth", np.ones(len(mesh.polygons), bool))
+            mesh.edges.foreach_set("use_edge_sharp", np.zeros(len(mesh.edges), bool))
 
-            # Switch to Edit Mode to work with edges
-            bpy.ops.object.mode_set(mode='EDIT')
-            bpy.ops.mesh.select_all(action='DESELECT')
-            
-            # Select all edges
-            bpy.ops.mesh.select_all(action='SELECT')
-            
-            # Mark selected edges as sharp
-            bpy.ops.mesh.mark_sharp(clear=True)
-            bpy.ops.mesh.average_normals(average_type= 'FACE_AREA', weight=50, threshold=0.01)
+            # Custom normals need auto smooth before Blender 4.1
+            if hasattr(mesh, "use_auto_smooth"):
+                mesh.use_auto_smooth = True
+                mesh.auto_smooth_angle = math.radians(30.0)
 
+            mesh.normals_split_custom_set_from_vertices(face_area_vertex_normals(mesh))
+            mesh.update()
+            vertex_count += len(mesh.vertices)
 
-            # Switch back to Object Mode
-            bpy.ops.object.mode_set(mode='OBJECT')
-            
-            print("Shade smooth, enabled auto smooth, marked edges as sharp, and weighted normals with the sharpen option.")
-        else:
-            print("No active mesh object selected.")
+        self.report({'INFO'}, "Shaded smooth and weighted normals by face area on {} meshes ({} vertices)".format(len(meshes), vertex_count))
         return {'FINISHED'}
    
               
@@ -158,6 +534,7 @@ class OBJECT_OT_ToggleWireframe(bpy.types.Operator):
     bl_idname = "object.toggle_wireframe"
     bl_description = "Toggle Wireframe Display for Selected Objects"
 
+    @profiled
     def execute(self, context):
         # Get the selected objects
         selected_objects = context.selected_objects
@@ -171,17 +548,61 @@ class OBJECT_OT_ToggleWireframe(bpy.types.Operator):
     
     
 
+def transform_objects(context):
+    objects = list(context.selected_objects)
+    if context.active_object and context.active_object not in objects:
+        objects.append(context.active_object)
+    return objects
+
+
+# The part of an object's basis matrix that stays on the object when only some
+# channels are frozen
+def kept_basis(obj, location, rotation, scale):
+    loc, rot, sca = obj.matrix_basis.decompose()
+    kept = Matrix.Identity(4)
+    if not location:
+        kept = Matrix.Translation(loc)
+    if not rotation:
+        kept = kept @ rot.to_matrix().to_4x4()
+    if not scale:
+        kept = kept @ Matrix.Diagonal(sca).to_4x4()
+    return kept
+
+
+def flip_faces(mesh):
+    bm = bmesh.new()
+    bm.from_mesh(mesh)
+    bmesh.ops.reverse_faces(bm, faces=bm.faces[:])
+    bm.to_mesh(mesh)
+    bm.free()
+
+
+# Give an object a new basis matrix while its children keep their world transform
+def set_basis_keep_children(obj, basis):
+    correction = basis.inverted() @ obj.matrix_basis
+    for child in obj.children:
+        child.matrix_parent_inverse = correction @ child.matrix_parent_inverse
+    obj.matrix_basis = basis
+
+
 class OBJECT_OT_ResetTransforms(bpy.types.Operator):
     bl_idname = "object.reset_transforms"
     bl_label = "Reset Transforms"
 
+    @profiled
     def execute(self, context):
-        obj = context.active_object
-        if obj is not None:
-            obj.location = (0, 0, 0)
-            obj.rotation_euler = (0, 0, 0)
-            obj.scale = (1, 1, 1)
-            self.report({'INFO'}, "Transforms reset for {}".format(obj.name))
+        objects = transform_objects(context)
+        if objects:
+            for obj in objects:
+                obj.location = (0, 0, 0)
+                obj.rotation_euler = (0, 0, 0)
+                obj.rotation_quaternion = (1, 0, 0, 0)
+                obj.rotation_axis_angle = (0, 0, 1, 0)
+                obj.scale = (1, 1, 1)
+            if len(objects) == 1:
+                self.report({'INFO'}, "Transforms reset for {}".format(objects[0].name))
+            else:
+                self.report({'INFO'}, "Transforms reset for {} objects".format(len(objects)))
         else:
             self.report({'WARNING'}, "No active object selected.")
         return {'FINISHED'}
@@ -189,29 +610,166 @@ class OBJECT_OT_ResetTransforms(bpy.types.Operator):
 class OBJECT_OT_FreezeTransforms(bpy.types.Operator):
     bl_idname = "object.freeze_transforms"
     bl_label = "Freeze Transforms"
-
+    bl_options = {'REGISTER', 'UNDO'}
+
+    location: bpy.props.BoolProperty(name="Location", default=True)
+    rotation: bpy.props.BoolProperty(name="Rotation", default=True)
+    scale: bpy.props.BoolProperty(name="Scale", default=True)
+
+    # Applies the frozen part of each transform straight to the mesh data in one pass.
+    # Meshes shared by several selected objects are transformed once and the other
+    # instances get a compensating basis; meshes also used by unselected objects are
+    # copied first so those keep their look. Children keep their world transform and
+    # negative scale flips the faces, like transform_apply.
+    @profiled
     def execute(self, context):
-        obj = context.active_object
-        if obj is not None:
-            bpy.ops.object.transform_apply(location=True, rotation=True, scale=True)
-            self.report({'INFO'}, "Transforms frozen for {}".format(obj.name))
-        else:
+        objects = transform_objects(context)
+        if not objects:
             self.report({'WARNING'}, "No active object selected.")
+            return {'FINISHED'}
+
+        if context.mode != 'OBJECT':
+            bpy.ops.object.mode_set(mode='OBJECT')
+
+        users = {}
+        skipped = 0
+        for obj in objects:
+            if obj.type == 'MESH':
+                users.setdefault(obj.data, []).append(obj)
+            else:
+                skipped += 1
+
+        frozen = 0
+        meshes = 0
+        for mesh, instances in users.items():
+            # A zero scale axis makes the basis singular: it cannot be inverted to keep
+            # children and other instances in place, so those meshes are left alone
+            singular = [obj for obj in instances if abs(obj.matrix_basis.determinant()) < 1e-12]
+            if singular:
+                for obj in singular:
+                    self.report({'WARNING'}, "Skipped {}: scale is zero on at least one axis".format(obj.name))
+                if len(singular) < len(instances):
+                    self.report({'WARNING'}, "Skipped {} other objects sharing their mesh".format(len(instances) - len(singular)))
+                continue
+
+            if mesh.users - int(mesh.use_fake_user) > len(instances):
+                mesh = mesh.copy()
+                for obj in instances:
+                    obj.data = mesh
+
+            first = instances[0]
+            delta = kept_basis(first, self.location, self.rotation, self.scale).inverted() @ first.matrix_basis
+            mesh.transform(delta, shape_keys=True)
+            if delta.determinant() < 0.0:
+                flip_faces(mesh)
+            mesh.update()
+
+            inverse = delta.inverted()
+            for obj in instances:
+                set_basis_keep_children(obj, obj.matrix_basis @ inverse)
+            frozen += len(instances)
+            meshes += 1
+
+        self.report({'INFO'}, "Transforms frozen for {} objects ({} meshes)".format(frozen, meshes))
+        if skipped:
+            self.report({'WARNING'}, "Skipped {} non-mesh objects".format(skipped))
         return {'FINISHED'}
 
+# Selected objects (plus the active one) whose data can hold materials
+def material_objects(context):
+    objects = list(context.selected_objects)
+    if context.active_object and context.active_object not in objects:
+        objects.append(context.active_object)
+    return [obj for obj in objects if getattr(obj.data, "materials", None) is not None]
+
+
+# Blender's duplicate suffix: M_Wood.001 -> M_Wood
+DUPLICATE_SUFFIX = re.compile(r"^(.*)\.\d{3,}$")
+
+
+# Map every duplicate material (M_Foo.001, M_Foo.002, ...) to its base material, or to
+# the lowest numbered duplicate when the base name is not in the file
+def duplicate_material_map(materials):
+    families = {}
+    for material in materials:
+        match = DUPLICATE_SUFFIX.match(material.name)
+        base_name = match.group(1) if match else material.name
+        families.setdefault(base_name, set()).add(material)
+
+    remap = {}
+    for base_name, members in families.items():
+        base = bpy.data.materials.get(base_name)
+        if base is None:
+            base = min(members, key=lambda material: material.name)
+        for material in members:
+            if material != base:
+                remap[material] = base
+    return remap
+
+
+# Point a mesh's slots at the merged materials. Slots that end up holding the same
+# material are collapsed and polygon material indices are remapped with one array lookup.
+def remap_mesh_materials(mesh, remap, merge_slots):
+    materials = list(mesh.materials)
+    targets = [remap.get(material, material) for material in materials]
+    if targets == materials:
+        return False
+
+    if not merge_slots:
+        for index, material in enumerate(targets):
+            mesh.materials[index] = material
+        return True
+
+    slots = []
+    slot_map = np.zeros(max(1, len(targets)), np.int32)
+    for index, material in enumerate(targets):
+        if material is not None and material in slots:
+            slot_map[index] = slots.index(material)
+        else:
+            slots.append(material)
+            slot_map[index] = len(slots) - 1
+
+    material_indices = np.empty(len(mesh.polygons), np.int32)
+    mesh.polygons.foreach_get("material_index", material_indices)
+    material_indices = slot_map[np.clip(material_indices, 0, len(targets) - 1)]
+
+    mesh.materials.clear()
+    for material in slots:
+        mesh.materials.append(material)
+    mesh.polygons.foreach_set("material_index", material_indices)
+    mesh.update()
+    return True
+
+
+# Remove materials nobody uses any more and return how many were freed
+def purge_orphan_materials():
+    orphans = [material for material in bpy.data.materials if material.users == 0]
+    for material in orphans:
+        bpy.data.materials.remove(material)
+    return len(orphans)
+
+
 class OBJECT_OT_DeleteMaterials(bpy.types.Operator):
     bl_idname = "object.delete_materials"
     bl_label = "Delete Materials"
 
+    @profiled
     def execute(self, context):
-        obj = context.active_object
-        if obj is not None:
-            obj.data.materials.clear()
+        objects = material_objects(context)
+        if not objects:
+            self.report({'WARNING'}, "No active object selected.")
+            return {'FINISHED'}
+
+        for data in {obj.data for obj in objects}:
+            data.materials.clear()
+        for obj in objects:
             for material_slot in obj.material_slots:
                 material_slot.material = None
-            self.report({'INFO'}, "Materials deleted for {}".format(obj.name))
+
+        if len(objects) == 1:
+            self.report({'INFO'}, "Materials deleted for {}".format(objects[0].name))
         else:
-            self.report({'WARNING'}, "No active object selected.")
+            self.report({'INFO'}, "Materials deleted for {} objects".format(len(objects)))
         return {'FINISHED'}
 
 class OBJECT_OT_AddMaterialSlot(bpy.types.Operator):
@@ -220,16 +778,25 @@ class OBJECT_OT_AddMaterialSlot(bpy.types.Operator):
     
     new_material_name: bpy.props.StringProperty(name="New Material Name", default="M_")
 
+    @profiled
     def execute(self, context):
-        obj = context.active_object
-        if obj is not None:
+        objects = material_objects(context)
+        if objects:
             if not self.new_material_name.startswith("M_"):
                 self.report({'WARNING'}, "Material name should start with 'M_'")
                 return {'CANCELLED'}
             
-            material = bpy.data.materials.new(name=self.new_material_name)  # Create a new material with the specified name
-            obj.data.materials.append(material)  # Append the new material to the object's material list
-            self.report({'INFO'}, "Material slot added to {} with name '{}'".format(obj.name, self.new_material_name))
+            # Reuse an existing material of that name instead of creating M_Foo.001
+            material = bpy.data.materials.get(self.new_material_name)
+            if material is None:
+                material = bpy.data.materials.new(name=self.new_material_name)
+
+            added = 0
+            for data in {obj.data for obj in objects}:
+                if material.name not in data.materials:
+                    data.materials.append(material)  # Append the material to the object's material list
+                    added += 1
+            self.report({'INFO'}, "Material '{}' added to {} of {} selected objects".format(material.name, added, len(objects)))
         else:
             self.report({'WARNING'}, "No active object selected.")
         return {'FINISHED'}
@@ -238,13 +805,63 @@ class OBJECT_OT_AddMaterialSlot(bpy.types.Operator):
         wm = context.window_manager
         return wm.invoke_props_dialog(self)
 
+class OBJECT_OT_MergeDuplicateMaterials(bpy.types.Operator):
+    bl_idname = "object.merge_duplicate_materials"
+    bl_label = "Merge Duplicate Materials"
+    bl_description = "Replace M_Foo.001 style duplicates on the selection with their base material and purge unused materials"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    purge_orphans: bpy.props.BoolProperty(name="Purge Unused", description="Remove materials left without users", default=True)
+
+    @profiled
+    def execute(self, context):
+        objects = material_objects(context)
+        if not objects:
+            self.report({'WARNING'}, "No objects selected.")
+            return {'CANCELLED'}
+
+        used = {material for obj in objects for material in obj.data.materials if material}
+        used.update(slot.material for obj in objects for slot in obj.material_slots if slot.material)
+        remap = duplicate_material_map(used)
+
+        # Object-linked slots pin slot positions, so those meshes are remapped in place
+        pinned = {obj.data for obj in objects if any(slot.link == 'OBJECT' for slot in obj.material_slots)}
+        changed = 0
+        for data in {obj.data for obj in objects}:
+            if remap_mesh_materials(data, remap, isinstance(data, bpy.types.Mesh) and data not in pinned):
+                changed += 1
+        for obj in objects:
+            for material_slot in obj.material_slots:
+                if material_slot.link == 'OBJECT' and material_slot.material in remap:
+                    material_slot.material = remap[material_slot.material]
+
+        freed = purge_orphan_materials() if self.purge_orphans else 0
+        self.report({'INFO'}, "Merged {} duplicate materials on {} meshes, freed {} materials".format(len(remap), changed, freed))
+        return {'FINISHED'}
+
 class OBJECT_OT_RenameSelected(bpy.types.Operator):
     bl_idname = "object.rename_selected"
     bl_label = "Rename Selected"
+    bl_options = {'REGISTER', 'UNDO'}
     
+    mode: bpy.props.EnumProperty(name="Mode", items=[
+        ('ACTIVE', "Active Object", "Give the active object a new name"),
+        ('SELECTION', "Selection", "Rename every selected object from a pattern"),
+    ], default='ACTIVE')
     new_name: bpy.props.StringProperty(name="New Name", default="SM_")
-
+    pattern: bpy.props.StringProperty(name="Pattern", description="Tokens: {prefix} {name} {collection} {index}", default="{prefix}{collection}_{index:03}")
+    prefix: bpy.props.StringProperty(name="Prefix", default="SM_")
+    find: bpy.props.StringProperty(name="Find", description="Regular expression applied to the current name for {name}")
+    replace: bpy.props.StringProperty(name="Replace", description="Replacement for Find, may use \\1 groups")
+    start_index: bpy.props.IntProperty(name="Start Index", default=1, min=0)
+    rename_data: bpy.props.BoolProperty(name="Rename Mesh Data", description="Give mesh datablocks the object's new name", default=False)
+    rename_materials: bpy.props.BoolProperty(name="Rename Materials", description="Rename materials to M_<object name> (suffixed per slot)", default=False)
+
+    @profiled
     def execute(self, context):
+        if self.mode == 'SELECTION':
+            return self.rename_selection(context)
+
         obj = context.active_object
         if obj is not None:
             if not self.new_name.startswith("SM_"):
@@ -257,13 +874,311 @@ class OBJECT_OT_RenameSelected(bpy.types.Operator):
             self.report({'WARNING'}, "No active object selected.")
         return {'FINISHED'}
 
+    # All target names are computed before the first assignment, against sets of the
+    # names that stay in use, so renaming N objects never makes Blender resolve collisions
+    def rename_selection(self, context):
+        objects = sorted(context.selected_objects, key=lambda obj: obj.name)
+        if not objects:
+            self.report({'WARNING'}, "No objects selected.")
+            return {'CANCELLED'}
+
+        try:
+            regex = re.compile(self.find) if self.find else None
+        except re.error as error:
+            self.report({'ERROR'}, "Invalid Find expression: {}".format(error))
+            return {'CANCELLED'}
+
+        taken = set(bpy.data.objects.keys()) - {obj.name for obj in objects}
+        object_names = []
+        for index, obj in enumerate(objects, self.start_index):
+            try:
+                name = regex.sub(self.replace, obj.name) if regex else obj.name
+            except re.error as error:
+                self.report({'ERROR'}, "Invalid Replace expression: {}".format(error))
+                return {'CANCELLED'}
+            collection = obj.users_collection[0].name if obj.users_collection else ""
+            try:
+                base = self.pattern.format(prefix=self.prefix, name=name, collection=collection, index=index)
+            except (KeyError, IndexError, ValueError, AttributeError, TypeError) as error:
+                self.report({'ERROR'}, "Invalid pattern: {}".format(error))
+                return {'CANCELLED'}
+            if not base.startswith("SM_"):
+                self.report({'WARNING'}, "New name '{}' should start with 'SM_'".format(base))
+                return {'CANCELLED'}
+            object_names.append((obj, unique_name(base, taken)))
+
+        data_names = []
+        if self.rename_data:
+            meshes = {}
+            for obj, target in object_names:
+                if obj.type == 'MESH' and obj.data not in meshes:
+                    meshes[obj.data] = target
+            taken = set(bpy.data.meshes.keys()) - {mesh.name for mesh in meshes}
+            data_names = [(mesh, unique_name(target, taken)) for mesh, target in meshes.items()]
+
+        material_names = []
+        if self.rename_materials:
+            materials = {}
+            for obj, target in object_names:
+                slots = [slot.material for slot in obj.material_slots]
+                for index, material in enumerate(slots):
+                    if material and material not in materials:
+                        base = "M_" + target[len("SM_"):]
+                        materials[material] = base if len(slots) == 1 else "{}_{:02d}".format(base, index + 1)
+            taken = set(bpy.data.materials.keys()) - {material.name for material in materials}
+            material_names = [(material, unique_name(target, taken)) for material, target in materials.items()]
+
+        for pairs in (object_names, data_names, material_names):
+            apply_names(pairs)
+
+        self.report({'INFO'}, "Renamed {} objects, {} meshes and {} materials".format(len(object_names), len(data_names), len(material_names)))
+        return {'FINISHED'}
+
     def invoke(self, context, event):
         wm = context.window_manager
         return wm.invoke_props_dialog(self)
 
+    def draw(self, context):
+        layout = self.layout
+        layout.prop(self, "mode", expand=True)
+        if self.mode == 'ACTIVE':
+            layout.prop(self, "new_name")
+        else:
+            layout.prop(self, "pattern")
+            layout.prop(self, "prefix")
+            layout.prop(self, "find")
+            layout.prop(self, "replace")
+            layout.prop(self, "start_index")
+            layout.prop(self, "rename_data")
+            layout.prop(self, "rename_materials")
+
+
+# First free name of the form base, base_01, base_02, ... checked against a set of
+# names instead of bpy.data lookups; the chosen name is added to `taken`
+def unique_name(base, taken):
+    name = base
+    index = 0
+    while name in taken:
+        index += 1
+        name = "{}_{:02d}".format(base, index)
+    taken.add(name)
+    return name
+
+
+# Assign precomputed unique names to (ID, name) pairs. IDs that still hold a name
+# another ID in the batch wants are parked on a temporary name first.
+def apply_names(pairs):
+    pending = [(data, target) for data, target in pairs if data.name != target]
+    wanted = {target for data, target in pending}
+    for index, (data, target) in enumerate(pending):
+        if data.name in wanted:
+            data.name = "~janitor_rename_{}".format(index)
+    for data, target in pending:
+        data.name = target
+
+
+# Index the objects and their materials in one pass and collect every naming problem:
+# objects without 'SM_' and materials (with the objects using them) without 'M_'
+def validate_naming(objects):
+    bad_objects = []
+    bad_materials = {}
+    for obj in objects:
+        if not obj.name.startswith("SM_"):
+            bad_objects.append(obj)
+        for material_slot in obj.material_slots:
+            material = material_slot.material
+            if material and not material.name.startswith("M_"):
+                users = bad_materials.setdefault(material, [])
+                if obj.name not in users:
+                    users.append(obj.name)
+    return bad_objects, bad_materials
+
+
+# Report at most this many individual naming problems, then a summary
+MAX_NAMING_REPORTS = 25
+
+
+class OBJECT_OT_FixNaming(bpy.types.Operator):
+    bl_idname = "object.fix_naming"
+    bl_label = "Fix Names"
+    bl_description = "Add the 'SM_' / 'M_' prefixes to every selected object and material missing them"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    @profiled
+    def execute(self, context):
+        bad_objects, bad_materials = validate_naming(context.selected_objects)
+        if not bad_objects and not bad_materials:
+            self.report({'INFO'}, "All selected objects and materials are named correctly")
+            return {'FINISHED'}
+
+        # Targets are computed up front against name sets, so Blender never has to
+        # resolve a collision with a .001 suffix
+        taken = set(bpy.data.objects.keys())
+        for obj in bad_objects:
+            obj.name = unique_name("SM_" + obj.name, taken)
+        taken = set(bpy.data.materials.keys())
+        for material in bad_materials:
+            material.name = unique_name("M_" + material.name, taken)
+
+        self.report({'INFO'}, "Renamed {} objects and {} materials".format(len(bad_objects), len(bad_materials)))
+        return {'FINISHED'}
+
+
+
+FBX_AXES = [(axis, axis, "") for axis in ('X', 'Y', 'Z', '-X', '-Y', '-Z')]
+
+FBX_SMOOTHING = [
+    ('OFF', "Normals Only", "Export only normals"),
+    ('FACE', "Face", "Write face smoothing"),
+    ('EDGE', "Edge", "Write edge smoothing"),
+]
+
+
+# Named set of export_scene.fbx arguments, stored with the scene
+class JanitorExportPreset(bpy.types.PropertyGroup):
+    axis_forward: bpy.props.EnumProperty(name="Forward", items=FBX_AXES, default='-Z')
+    axis_up: bpy.props.EnumProperty(name="Up", items=FBX_AXES, default='Y')
+    global_scale: bpy.props.FloatProperty(name="Scale", default=1.0, min=0.001, max=1000.0)
+    apply_unit_scale: bpy.props.BoolProperty(name="Apply Unit", default=True)
+    use_tspace: bpy.props.BoolProperty(name="Tangent Space", default=False)
+    mesh_smooth_type: bpy.props.EnumProperty(name="Smoothing", items=FBX_SMOOTHING, default='OFF')
+    use_mesh_modifiers: bpy.props.BoolProperty(name="Apply Modifiers", default=True)
+
+
+# export_scene.fbx arguments a preset controls. Objects override them with custom
+# properties named fbx_<argument>, e.g. obj["fbx_global_scale"] = 100.0
+FBX_PRESET_FIELDS = ("axis_forward", "axis_up", "global_scale", "apply_unit_scale", "use_tspace", "mesh_smooth_type", "use_mesh_modifiers")
+
+
+def active_export_preset(scene):
+    presets = scene.janitor_export_presets
+    index = scene.janitor_export_preset_index
+    return presets[index] if 0 <= index < len(presets) else None
+
+
+# Check an fbx_<field> custom property against the preset property it overrides.
+# Returns (value, None) or (None, problem).
+def validate_export_override(field, value):
+    prop = JanitorExportPreset.bl_rna.properties[field]
+    if prop.type == 'ENUM':
+        identifiers = [item.identifier for item in prop.enum_items]
+        if not isinstance(value, str) or value not in identifiers:
+            return None, "fbx_{} must be one of {}, got {!r}".format(field, ", ".join(identifiers), value)
+        return value, None
+    if prop.type == 'BOOLEAN':
+        if not isinstance(value, int) or value not in (0, 1):
+            return None, "fbx_{} must be 0 or 1, got {!r}".format(field, value)
+        return bool(value), None
+
+    if isinstance(value, str) or not isinstance(value, (int, float)):
+        return None, "fbx_{} must be a number, got {!r}".format(field, value)
+    if not prop.hard_min <= value <= prop.hard_max:
+        return None, "fbx_{} must be between {} and {}, got {}".format(field, prop.hard_min, prop.hard_max, value)
+    return float(value), None
+
+
+# Resolve the export settings of all objects once per batch into a table of distinct
+# argument sets plus the table row of every object name, so a batch never re-reads
+# presets or custom properties per file. Objects with invalid overrides get no row and
+# are returned as (object, problem) pairs instead.
+def resolve_export_settings(scene, objects):
+    preset = active_export_preset(scene)
+    base = {field: getattr(preset, field) for field in FBX_PRESET_FIELDS} if preset else {}
+    table = []
+    rows = {}
+    index = {}
+    problems = []
+    for obj in objects:
+        settings = dict(base)
+        errors = []
+        for field in FBX_PRESET_FIELDS:
+            value = obj.get("fbx_" + field)
+            if value is not None:
+                value, problem = validate_export_override(field, value)
+                if problem:
+                    errors.append(problem)
+                else:
+                    settings[field] = value
+
+        # The exporter rejects forward and up on the same axis
+        properties = JanitorExportPreset.bl_rna.properties
+        forward = settings.get("axis_forward", properties["axis_forward"].default)
+        up = settings.get("axis_up", properties["axis_up"].default)
+        if not errors and forward[-1] == up[-1]:
+            errors.append("Forward axis {} and up axis {} are the same axis".format(forward, up))
+        if errors:
+            problems.extend((obj, problem) for problem in errors)
+            continue
+
+        key = json.dumps(settings, sort_keys=True)
+        if key not in rows:
+            rows[key] = len(table)
+            table.append(settings)
+        index[obj.name] = rows[key]
+    return table, index, problems
+
+
+class OBJECT_OT_ExportPresetAdd(bpy.types.Operator):
+    bl_idname = "object.janitor_export_preset_add"
+    bl_label = "Add Export Preset"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        scene = context.scene
+        preset = scene.janitor_export_presets.add()
+        preset.name = unique_name("Preset", {item.name for item in scene.janitor_export_presets})
+        scene.janitor_export_preset_index = len(scene.janitor_export_presets) - 1
+        return {'FINISHED'}
+
+
+class OBJECT_OT_ExportPresetRemove(bpy.types.Operator):
+    bl_idname = "object.janitor_export_preset_remove"
+    bl_label = "Remove Export Preset"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        scene = context.scene
+        if active_export_preset(scene) is None:
+            return {'CANCELLED'}
+        scene.janitor_export_presets.remove(scene.janitor_export_preset_index)
+        scene.janitor_export_preset_index = min(scene.janitor_export_preset_index, len(scene.janitor_export_presets) - 1)
+        return {'FINISHED'}
+
 
+class OBJECT_UL_ExportPresets(bpy.types.UIList):
+    def draw_item(self, context, layout, data, item, icon, active_data, active_propname, index):
+        layout.prop(item, "name", text="", emboss=False)
 
-class OBJECT_OT_BatchExportFBX(bpy.types.Operator, ExportHelper):
+
+class OBJECT_PT_ExportPresets(bpy.types.Panel):
+    bl_label = "Export Presets"
+    bl_idname = "PT_JanitorExportPresets"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category = 'JanitorTools'
+    bl_parent_id = "PT_ScaleDisplay"
+    bl_options = {'DEFAULT_CLOSED'}
+
+    def draw(self, context):
+        layout = self.layout
+        scene = context.scene
+        row = layout.row()
+        row.template_list("OBJECT_UL_ExportPresets", "", scene, "janitor_export_presets", scene, "janitor_export_preset_index", rows=3)
+        col = row.column(align=True)
+        col.operator("object.janitor_export_preset_add", text="", icon='ADD')
+        col.operator("object.janitor_export_preset_remove", text="", icon='REMOVE')
+
+        preset = active_export_preset(scene)
+        if preset is None:
+            layout.label(text="No preset selected: FBX defaults")
+            return
+        col = layout.column(align=True)
+        for field in FBX_PRESET_FIELDS:
+            col.prop(preset, field)
+        layout.label(text="Objects override with fbx_<setting> properties")
+
+
+class OBJECT_OT_BatchExportFBX(JanitorJob, bpy.types.Operator, ExportHelper):
     bl_idname = "object.batch_export_fbx"
     bl_label = "Batch Export FBX"
     bl_options = {'REGISTER'}
@@ -271,253 +1186,1795 @@ class OBJECT_OT_BatchExportFBX(bpy.types.Operator, ExportHelper):
     filename_ext = ".fbx"
 
     filter_glob: StringProperty(default="*.fbx", options={'HIDDEN'})
+    group_by: bpy.props.EnumProperty(name="Group By", items=EXPORT_GROUPINGS, default='NONE')
 
+    @profiled
     def execute(self, context):
         selected_objects = bpy.context.selected_objects
         if not selected_objects:
             self.report({'WARNING'}, "No objects selected for export")
             return {'CANCELLED'}
 
-        # Check prefixes for objects and materials
-        for obj in selected_objects:
-            if not obj.name.startswith("SM_"):
-                self.report({'WARNING'}, "Object '{}' does not have the correct prefix 'SM_'".format(obj.name))
-                return {'CANCELLED'}
-            for material_slot in obj.material_slots:
-                if material_slot.material and not material_slot.material.name.startswith("M_"):
-                    self.report({'WARNING'}, "Material '{}' on object '{}' does not have the correct prefix 'M_'".format(material_slot.material.name, obj.name))
-                    return {'CANCELLED'}
+        # Check prefixes for objects and materials, reporting every problem at once
+        bad_objects, bad_materials = validate_naming(selected_objects)
+        problems = ["Object '{}' does not have the correct prefix 'SM_'".format(obj.name) for obj in bad_objects]
+        problems += ["Material '{}' on object '{}' does not have the correct prefix 'M_'".format(material.name, "', '".join(users))
+                     for material, users in bad_materials.items()]
+        if problems:
+            for problem in problems[:MAX_NAMING_REPORTS]:
+                self.report({'WARNING'}, problem)
+            self.report({'WARNING'}, "{} naming problems found, use Fix Names to add the missing prefixes".format(len(problems)))
+            return {'CANCELLED'}
 
-        # Export the objects
-        for obj in selected_objects:
-            filepath = self.filepath
-            if not filepath.lower().endswith('.fbx'):
-                filepath += '.fbx'
-            bpy.ops.export_scene.fbx(filepath=filepath, use_selection=True, object_types={'MESH'})
+        filepath = self.filepath
+        if not filepath.lower().endswith('.fbx'):
+            filepath += '.fbx'
 
-        self.report({'INFO'}, "Exported {} objects to FBX".format(len(selected_objects)))
+        # Write each group once instead of re-exporting the whole selection per object
+        # Objects with invalid fbx_* overrides are reported and left out
+        self.settings, self.settings_index, problems = resolve_export_settings(context.scene, selected_objects)
+        for obj, problem in problems:
+            self.report({'WARNING'}, "Skipped '{}': {}".format(obj.name, problem))
+        selected_objects = [obj for obj in selected_objects if obj.name in self.settings_index]
+        if not selected_objects:
+            self.report({'ERROR'}, "No objects left to export")
+            return {'CANCELLED'}
+
+        self.export_path = filepath
+        self.object_count = len(selected_objects)
+        self.files_written = 0
+        self.selection = _Selection(context)
+        self.manifest = ManifestWriter(filepath[:-4] + "_manifest.jsonl", truncate=True)
+        # A file has one set of export settings, so objects of a group whose overrides
+        # resolve to different settings go to one file per settings row: <group>_<n>.fbx,
+        # numbered by the alphabetically first object of each part
+        jobs = []
+        for key, objects in group_objects(selected_objects, self.group_by).items():
+            rows = {}
+            for obj in objects:
+                rows.setdefault(self.settings_index[obj.name], []).append(obj.name)
+            parts = sorted(rows.values(), key=min)
+            if len(parts) > 1:
+                self.report({'WARNING'}, "{} uses {} different export settings, writing {} files".format(
+                    "'{}'".format(key) if key else "The selection", len(parts), len(parts)))
+            for number, names in enumerate(parts, 1):
+                jobs.append((key, number if len(parts) > 1 else 0, names))
+        return self.start_job(context, jobs)
+
+    def job_step(self, context, groups):
+        for key, number, names in groups:
+            objects = [bpy.data.objects[name] for name in names if name in bpy.data.objects]
+            path = self.export_path
+            if self.group_by != 'NONE':
+                path = "{}_{}.fbx".format(self.export_path[:-4], bpy.path.clean_name(key))
+            if number:
+                path = "{}_{}.fbx".format(path[:-4], number)
+
+            # Every object of a part resolves to the same settings row
+            settings = self.settings[self.settings_index[names[0]]]
+            start = time.perf_counter()
+            self.selection.select(objects)
+            bpy.ops.export_scene.fbx(filepath=path, use_selection=True, object_types={'MESH'}, **settings)
+            seconds = time.perf_counter() - start
+            self.files_written += 1
+
+            salt = json.dumps(settings, sort_keys=True)
+            content_hash = hashlib.sha1((salt + "".join(object_content_hash(obj) for obj in objects)).encode()).hexdigest()
+            entry = {"object": key if key and not number else os.path.basename(path)[:-4], "objects": [obj.name for obj in objects], "file": path, "seconds": round(seconds, 3)}
+            self.manifest.write(manifest_record(entry, objects, content_hash))
+            self.report({'INFO'}, "Wrote {} ({} objects) in {:.2f}s".format(path, len(objects), seconds))
+
+    def job_finish(self, context, cancelled):
+        self.selection.restore()
+        self.manifest.close()
+        self.report({'INFO'}, "Exported {} objects to {} FBX file(s)".format(self.object_count, self.files_written))
+        self.report({'INFO'}, "Manifest: " + self.manifest.path)
+        return {'CANCELLED'} if cancelled else {'FINISHED'}
+
+
+# Split export writers. Each one exports the current selection to a path and maps the
+# resolved FBX preset settings onto its own operator arguments.
+def _write_fbx(path, settings):
+    bpy.ops.export_scene.fbx(filepath=path, use_selection=True, **settings)
+
+
+def _write_glb(path, settings):
+    options = {"filepath": path, "export_format": 'GLB', "export_apply": settings.get("use_mesh_modifiers", True),
+               "export_tangents": settings.get("use_tspace", False)}
+    # The selection flag of the glTF exporter was renamed in Blender 2.91
+    if "use_selection" in bpy.ops.export_scene.gltf.get_rna_type().properties.keys():
+        options["use_selection"] = True
+    else:
+        options["export_selected"] = True
+    bpy.ops.export_scene.gltf(**options)
+
+
+# The built-in OBJ exporter (Blender 3.2+) replaced the Python add-on operator in 4.0
+def _write_obj(path, settings):
+    forward = settings.get("axis_forward", '-Z')
+    up = settings.get("axis_up", 'Y')
+    scale = settings.get("global_scale", 1.0)
+    modifiers = settings.get("use_mesh_modifiers", True)
+    if "obj_export" in dir(bpy.ops.wm):
+        bpy.ops.wm.obj_export(filepath=path, export_selected_objects=True, apply_modifiers=modifiers, global_scale=scale,
+                              forward_axis=forward.replace("-", "NEGATIVE_"), up_axis=up.replace("-", "NEGATIVE_"))
+    else:
+        bpy.ops.export_scene.obj(filepath=path, use_selection=True, use_mesh_modifiers=modifiers, global_scale=scale,
+                                 axis_forward=forward, axis_up=up)
+
+
+# Format -> (file extension, writer)
+EXPORT_WRITERS = {
+    'FBX': (".fbx", _write_fbx),
+    'GLB': (".glb", _write_glb),
+    'OBJ': (".obj", _write_obj),
+}
+
+EXPORT_FORMATS = [
+    ('FBX', "FBX", "Autodesk FBX"),
+    ('GLB', "glTF Binary", "Single file glTF 2.0 (.glb)"),
+    ('OBJ', "OBJ", "Wavefront OBJ"),
+]
+
+
+# Collect phase: the selected objects, minus the _LOD children that travel inside
+# their parent's files
+def collect_export_objects(context, include_lods):
+    objects = list(context.selected_objects)
+    if include_lods:
+        objects = [obj for obj in objects if not (obj.parent and LOD_SUFFIX.search(obj.name))]
+    return objects
+
+
+# Validate phase: (object, problem) pairs for names that cannot be used as file names
+# or that collide on case-insensitive file systems
+def validate_export_objects(objects):
+    problems = []
+    seen = {}
+    for obj in objects:
+        if any(char in obj.name for char in '/\\:*?"<>|'):
+            problems.append((obj, "Object name is not a valid file name"))
+            continue
+        other = seen.setdefault(obj.name.lower(), obj)
+        if other is not obj:
+            problems.append((obj, "File name collides with " + other.name))
+    return problems
+
+
+# Write phase: select one object (with its _LOD children when include_lods is set) once
+# and write it in every requested format to <directory>/<name>.<ext>. Returns one log
+# entry per file. Shared by the in-process split export job and the background workers.
+def export_split_object(selection, obj, directory, formats, include_lods=False, settings=None):
+    selection.select([obj] + (lod_children(obj) if include_lods else []))
+    entries = []
+    for export_format in formats:
+        extension, writer = EXPORT_WRITERS[export_format]
+        entry = {"object": obj.name, "format": export_format, "file": os.path.join(directory, obj.name + extension)}
+        start = time.perf_counter()
+        try:
+            writer(entry["file"], settings or {})
+        except RuntimeError as error:
+            entry["error"] = str(error)
+        entry["seconds"] = round(time.perf_counter() - start, 3)
+        entries.append(entry)
+    return entries
+
+
+# `tasks` are (object, formats) pairs; `settings` maps object names to their row of
+# the resolved settings table
+def export_split_objects(context, tasks, directory, include_lods=False, settings=None):
+    selection = _Selection(context)
+    try:
+        for obj, formats in tasks:
+            yield from export_split_object(selection, obj, directory, formats, include_lods, settings.get(obj.name) if settings else None)
+    finally:
+        selection.restore()
+
+
+def _read_jsonl(path):
+    if not os.path.exists(path):
+        return []
+    with open(path) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+# Merge per-shard logs into one file sorted by object name, so the log is the same
+# no matter how the objects were sharded or in which order the workers finished
+def write_export_log(directory, entries):
+    path = os.path.join(directory, "janitor_export_log.jsonl")
+    with open(path, "w") as f:
+        for entry in sorted(entries, key=lambda e: (e["object"], e.get("file", ""))):
+            f.write(json.dumps(entry, sort_keys=True) + "\n")
+    return path
+
+
+# Streaming catalog of the files an export wrote, kept next to the split export output
+MANIFEST_NAME = "janitor_manifest.jsonl"
+
+
+# Appends one JSON line per record with a single write on an O_APPEND descriptor, so
+# the UI process and background workers can stream into the same manifest and readers
+# see every finished file right away
+class ManifestWriter:
+    def __init__(self, path, truncate=False):
+        flags = os.O_WRONLY | os.O_CREAT | os.O_APPEND | (os.O_TRUNC if truncate else 0)
+        self.path = path
+        self.fd = os.open(path, flags, 0o644)
+
+    def write(self, record):
+        os.write(self.fd, (json.dumps(record, sort_keys=True) + "\n").encode())
+
+    def close(self):
+        os.close(self.fd)
+
+
+# Manifest line of one written file: its log entry plus what an importer needs to
+# catalog it without opening it (size, triangles, materials, world bounds, content hash)
+def manifest_record(entry, objects, content_hash):
+    record = dict(entry)
+    record["bytes"] = os.path.getsize(entry["file"]) if os.path.exists(entry["file"]) else 0
+    record["hash"] = content_hash
+    tris = 0
+    materials = set()
+    corners = []
+    for obj in objects:
+        if obj.type == 'MESH':
+            loop_totals = np.empty(len(obj.data.polygons), np.int32)
+            obj.data.polygons.foreach_get("loop_total", loop_totals)
+            tris += int((loop_totals - 2).sum())
+        materials.update(slot.material.name for slot in obj.material_slots if slot.material)
+        matrix = np.array(obj.matrix_world, dtype=np.float64)
+        box = np.array([tuple(corner) for corner in obj.bound_box], dtype=np.float64)
+        corners.append(box @ matrix[:3, :3].T + matrix[:3, 3])
+    record["tris"] = tris
+    record["materials"] = sorted(materials)
+    if corners:
+        corners = np.concatenate(corners)
+        record["bounds"] = {"min": corners.min(axis=0).round(6).tolist(), "max": corners.max(axis=0).round(6).tolist()}
+    return record
+
+
+def split_export_record(entry, include_lods, content_hash):
+    obj = bpy.data.objects[entry["object"]]
+    return manifest_record(entry, [obj] + (lod_children(obj) if include_lods else []), content_hash)
+
+
+# Entry point of a background worker:
+#   blender --background scene.blend --python JanitorTools.py -- --janitor-export-worker job.json
+def run_export_worker(job_path):
+    with open(job_path) as f:
+        job = json.load(f)
+
+    with open(job["log"], "w") as log:
+        tasks = []
+        for name, formats in job["objects"]:
+            obj = bpy.data.objects.get(name)
+            if obj is None:
+                log.write(json.dumps({"object": name, "error": "Object not found in worker scene"}) + "\n")
+            else:
+                tasks.append((obj, formats))
+
+        # One line per finished file, flushed so the UI process can follow progress;
+        # the shared manifest gets its line first
+        manifest = ManifestWriter(job["manifest"]) if job.get("manifest") else None
+        settings = {name: job["settings"][row] for name, row in job.get("settings_index", {}).items()}
+        try:
+            for entry in export_split_objects(bpy.context, tasks, job["directory"], job.get("include_lods", False), settings):
+                if manifest and "error" not in entry:
+                    manifest.write(split_export_record(entry, job.get("include_lods", False), job["hashes"].get(entry["object"])))
+                log.write(json.dumps(entry) + "\n")
+                log.flush()
+        finally:
+            if manifest:
+                manifest.close()
+
+
+# Name of the incremental export manifest kept inside the split export directory
+EXPORT_CACHE_NAME = ".janitor_export_cache.json"
+
+
+# Flatten the editable RNA properties of a struct (e.g. a modifier) into a string
+def _rna_signature(struct):
+    values = []
+    for prop in struct.bl_rna.properties:
+        if prop.identifier == "rna_type" or prop.type == 'COLLECTION':
+            continue
+        value = getattr(struct, prop.identifier, None)
+        if prop.type == 'POINTER':
+            value = getattr(value, "name", None)
+        elif isinstance(value, set):
+            value = sorted(value)
+        elif hasattr(value, "__len__") and not isinstance(value, str):
+            value = tuple(value)
+        values.append("{}={!r}".format(prop.identifier, value))
+    return ";".join(values)
+
+
+# Feed the raw mesh arrays into a hash with foreach_get instead of walking elements
+def _hash_mesh(h, mesh):
+    for collection, attribute, dtype, width in (
+        (mesh.vertices, "co", np.float32, 3),
+        (mesh.edges, "vertices", np.int32, 2),
+        (mesh.edges, "use_edge_sharp", bool, 1),
+        (mesh.loops, "vertex_index", np.int32, 1),
+        (mesh.polygons, "loop_total", np.int32, 1),
+        (mesh.polygons, "material_index", np.int32, 1),
+        (mesh.polygons, "use_smooth", bool, 1),
+    ):
+        values = np.empty(len(collection) * width, dtype=dtype)
+        collection.foreach_get(attribute, values)
+        h.update(values.tobytes())
+
+    for layer in mesh.uv_layers:
+        uvs = np.empty(len(layer.data) * 2, dtype=np.float32)
+        layer.data.foreach_get("uv", uvs)
+        h.update(layer.name.encode())
+        h.update(uvs.tobytes())
+
+    # Custom split normals (Smooth Weights changes only these). Before 4.1 the loop
+    # normals have to be computed first.
+    if mesh.has_custom_normals:
+        if hasattr(mesh, "calc_normals_split"):
+            mesh.calc_normals_split()
+        normals = np.empty(len(mesh.loops) * 3, dtype=np.float32)
+        mesh.loops.foreach_get("normal", normals)
+        h.update(normals.tobytes())
+
+    if mesh.shape_keys:
+        for block in mesh.shape_keys.key_blocks:
+            coords = np.empty(len(block.data) * 3, dtype=np.float32)
+            block.data.foreach_get("co", coords)
+            h.update("{}:{}:{}:{}:{}".format(block.name, block.value, block.mute, block.relative_key.name, block.vertex_group).encode())
+            h.update(coords.tobytes())
+
+    # Vertex group weights live per vertex; groups are referenced by index here and
+    # by name on the object
+    weights = [(vert.index, group.group, group.weight) for vert in mesh.vertices for group in vert.groups]
+    h.update(np.array(weights, dtype=np.float64).tobytes())
+
+    # Color attributes replaced vertex colors in Blender 3.2
+    colors = getattr(mesh, "color_attributes", None)
+    for layer in colors if colors is not None else mesh.vertex_colors:
+        values = np.empty(len(layer.data) * 4, dtype=np.float32)
+        layer.data.foreach_get("color", values)
+        h.update("{}:{}:{}".format(layer.name, getattr(layer, "domain", "CORNER"), getattr(layer, "data_type", "BYTE_COLOR")).encode())
+        h.update(values.tobytes())
+
+
+# Hash everything that ends up in an object's FBX: mesh data (including custom
+# normals, shape keys, vertex weights and colors), transform, modifier settings and
+# material assignments
+def object_content_hash(obj, salt=""):
+    h = hashlib.sha1(salt.encode())
+    h.update(obj.type.encode())
+    h.update(np.array(obj.matrix_world, dtype=np.float64).tobytes())
+    if obj.type == 'MESH':
+        _hash_mesh(h, obj.data)
+        h.update("|".join(group.name for group in obj.vertex_groups).encode())
+    for modifier in obj.modifiers:
+        h.update(_rna_signature(modifier).encode())
+    for slot in obj.material_slots:
+        h.update("{}:{}".format(slot.link, slot.material.name if slot.material else "").encode())
+    return h.hexdigest()
+
+
+def load_export_cache(directory):
+    path = os.path.join(directory, EXPORT_CACHE_NAME)
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path) as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    # Version 1 was keyed by object name and only knew FBX files
+    return manifest.get("objects", {}) if manifest.get("version") == 2 else {}
+
+
+def save_export_cache(directory, cache):
+    with open(os.path.join(directory, EXPORT_CACHE_NAME), "w") as f:
+        json.dump({"version": 2, "objects": cache}, f, indent=1, sort_keys=True)
+
+
+# Workers re-run this script with --python, so it has to be a file on disk. Run from
+# the Text Editor, __file__ names the text block instead; the caller then does the
+# work in this Blender.
+def background_workers_available(operator):
+    if os.path.isfile(__file__):
+        return True
+    operator.report({'WARNING'}, "Background workers need the add-on installed or saved as a file, running in this Blender instead")
+    return False
+
+
+# Start one background Blender per job on a copy of the current file. Every job gets a
+# "log" path; the worker writes one JSON line per finished item there. Returns the work
+# directory and (process, job, output file) per worker.
+def start_background_workers(flag, jobs):
+    workdir = tempfile.mkdtemp(prefix="janitor_")
+    blend_path = os.path.join(workdir, "scene.blend")
+    bpy.ops.wm.save_as_mainfile(filepath=blend_path, copy=True)
+
+    workers = []
+    for index, job in enumerate(jobs):
+        job["log"] = os.path.join(workdir, "shard_{}.jsonl".format(index))
+        job_path = os.path.join(workdir, "shard_{}.json".format(index))
+        with open(job_path, "w") as f:
+            json.dump(job, f)
+
+        output = open(os.path.join(workdir, "shard_{}.txt".format(index)), "w")
+        process = subprocess.Popen(
+            [bpy.app.binary_path, "--background", "--factory-startup", blend_path,
+             "--python-exit-code", "1", "--python", __file__, "--", flag, job_path],
+            stdout=output, stderr=subprocess.STDOUT)
+        workers.append((process, job, output))
+    return workdir, workers
+
+
+# Items finished so far, counted from the worker logs
+def background_workers_progress(workers):
+    return sum(len(_read_jsonl(job["log"])) for process, job, output in workers)
+
+
+def background_workers_running(workers):
+    return any(process.poll() is None for process, job, output in workers)
+
+
+# Wait for (or terminate) the workers and return (job, log entries, exit code, output
+# path) per worker
+def finish_background_workers(workers, terminate=False):
+    results = []
+    for process, job, output in workers:
+        if terminate and process.poll() is None:
+            process.terminate()
+        process.wait()
+        output.close()
+        results.append((job, _read_jsonl(job["log"]), process.returncode, output.name))
+    return results
+
+
+# Blocking variant for operators that are not modal jobs, with a progress bar
+def run_background_workers(context, flag, jobs, total):
+    workdir, workers = start_background_workers(flag, jobs)
+    wm = context.window_manager
+    wm.progress_begin(0, total)
+    try:
+        while background_workers_running(workers):
+            time.sleep(0.25)
+            wm.progress_update(background_workers_progress(workers))
+    finally:
+        wm.progress_end()
+    return workdir, finish_background_workers(workers)
+
+
+# Suffix of generated level-of-detail objects: SM_Crate_LOD1, SM_Crate_LOD2, ...
+LOD_SUFFIX = re.compile(r"_LOD(\d+)$")
+
+# Decimated meshes are cached here, one .blend per mesh content hash and ratio
+LOD_CACHE_DIR = os.path.join(tempfile.gettempdir(), "janitor_lod_cache")
+
+
+def parse_lod_ratios(text):
+    ratios = []
+    for value in text.split(","):
+        if not value.strip():
+            continue
+        ratio = float(value)
+        if not 0.0 < ratio < 1.0:
+            raise ValueError("LOD ratios must be between 0 and 1, got {}".format(value.strip()))
+        ratios.append(ratio)
+    return ratios
+
+
+def lod_children(obj):
+    return sorted((child for child in obj.children if child.type == 'MESH' and LOD_SUFFIX.search(child.name)),
+                  key=lambda child: child.name)
+
+
+def mesh_content_hash(mesh):
+    h = hashlib.sha1()
+    _hash_mesh(h, mesh)
+    return h.hexdigest()
+
+
+def lod_cache_path(mesh_hash, ratio):
+    return os.path.join(LOD_CACHE_DIR, "{}_{:.4f}.blend".format(mesh_hash, ratio))
+
+
+# Collapse-decimate `mesh` into a new mesh through a temporary object with a Decimate modifier
+def decimate_mesh(context, mesh, ratio):
+    obj = bpy.data.objects.new("janitor_lod_tmp", mesh)
+    context.scene.collection.objects.link(obj)
+    try:
+        modifier = obj.modifiers.new("Decimate", 'DECIMATE')
+        modifier.ratio = ratio
+        return bpy.data.meshes.new_from_object(obj.evaluated_get(context.evaluated_depsgraph_get()))
+    finally:
+        bpy.data.objects.remove(obj)
+
+
+# Cached meshes are written without materials so loading them never duplicates any;
+# the slots are refilled from the source mesh
+def write_lod_cache(path, lod):
+    for index in range(len(lod.materials)):
+        lod.materials[index] = None
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    bpy.data.libraries.write(path, {lod}, fake_user=True)
+
+
+def read_lod_cache(path):
+    with bpy.data.libraries.load(path) as (data_from, data_to):
+        data_to.meshes = data_from.meshes[:1]
+    lod = data_to.meshes[0]
+    lod.use_fake_user = False
+    return lod
+
+
+# Entry point of a background LOD worker:
+#   blender --background scene.blend --python JanitorTools.py -- --janitor-lod-worker job.json
+def run_lod_worker(job_path):
+    with open(job_path) as f:
+        job = json.load(f)
+
+    with open(job["log"], "w") as log:
+        for task in job["tasks"]:
+            entry = dict(task)
+            mesh = bpy.data.meshes.get(task["mesh"])
+            if mesh is None:
+                entry["error"] = "Mesh not found in worker scene"
+            else:
+                try:
+                    write_lod_cache(task["path"], decimate_mesh(bpy.context, mesh, task["ratio"]))
+                except (RuntimeError, OSError) as error:
+                    entry["error"] = str(error)
+            log.write(json.dumps(entry) + "\n")
+            log.flush()
+
+
+# Point <object>_LOD<level> at `mesh`, creating it as an unmoved child of `obj` if needed
+def assign_lod(obj, level, mesh):
+    name = "{}_LOD{}".format(obj.name, level)
+    lod = bpy.data.objects.get(name)
+    if lod is None or lod.type != 'MESH':
+        lod = bpy.data.objects.new(name, mesh)
+        for collection in obj.users_collection:
+            collection.objects.link(lod)
+    else:
+        previous = lod.data
+        lod.data = mesh
+        if previous.users == 0:
+            bpy.data.meshes.remove(previous)
+    lod.parent = obj
+    lod.matrix_parent_inverse = Matrix.Identity(4)
+    lod.matrix_basis = Matrix.Identity(4)
+    mesh.name = "{}_LOD{}".format(obj.data.name, level)
+    return lod
+
+
+class OBJECT_OT_GenerateLODs(bpy.types.Operator):
+    bl_idname = "object.generate_lods"
+    bl_label = "Generate LODs"
+    bl_description = "Add decimated _LOD1, _LOD2, ... copies of the selected meshes as their children"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    ratios: bpy.props.StringProperty(name="Ratios", description="Comma separated decimate ratio of every LOD", default="0.5,0.25,0.125")
+    use_workers: bpy.props.BoolProperty(name="Background Workers", description="Decimate in parallel background Blender processes", default=False)
+    worker_count: bpy.props.IntProperty(name="Workers", description="Number of worker processes (0 = one per CPU core)", default=0, min=0)
+    use_cache: bpy.props.BoolProperty(name="Use Cache", description="Reuse the decimated meshes of unchanged assets", default=True)
+
+    @profiled
+    def execute(self, context):
+        try:
+            ratios = parse_lod_ratios(self.ratios)
+        except ValueError as error:
+            self.report({'ERROR'}, str(error))
+            return {'CANCELLED'}
+        objects = [obj for obj in context.selected_objects if obj.type == 'MESH' and not LOD_SUFFIX.search(obj.name)]
+        if not ratios or not objects:
+            self.report({'ERROR'}, "Select mesh objects and give at least one LOD ratio.")
+            return {'CANCELLED'}
+
+        if context.mode != 'OBJECT':
+            bpy.ops.object.mode_set(mode='OBJECT')
+
+        lods, cached = self.lod_meshes(context, {obj.data for obj in objects}, ratios)
+        lod_count = 0
+        for obj in objects:
+            for level, ratio in enumerate(ratios, 1):
+                lod = lods.get((obj.data.name, ratio))
+                if lod is not None:
+                    assign_lod(obj, level, lod)
+                    lod_count += 1
+            # LODs beyond the current ratio list are stale
+            for child in lod_children(obj):
+                if int(LOD_SUFFIX.search(child.name).group(1)) > len(ratios):
+                    bpy.data.objects.remove(child)
+
+        self.report({'INFO'}, "Generated {} LOD objects for {} objects ({} meshes from the cache)".format(lod_count, len(objects), cached))
         return {'FINISHED'}
 
+    # (mesh name, ratio) -> decimated mesh with the source materials, and how many
+    # of them came from the cache. Meshes with identical geometry (Shift+D duplicates)
+    # share a cache path; each path is decimated once and the others read its file.
+    def lod_meshes(self, context, meshes, ratios):
+        sources = {}
+        pending = {}
+        for mesh in meshes:
+            mesh_hash = mesh_content_hash(mesh)
+            for ratio in ratios:
+                path = lod_cache_path(mesh_hash, ratio)
+                sources[(mesh.name, ratio)] = path
+                if path not in pending and (not self.use_cache or not os.path.exists(path)):
+                    pending[path] = {"mesh": mesh.name, "ratio": ratio, "path": path}
+        cached = sum(1 for path in sources.values() if path not in pending)
+        pending = list(pending.values())
+
+        if self.use_workers and len(pending) > 1 and background_workers_available(self):
+            count = min(self.worker_count or os.cpu_count() or 1, len(pending))
+            jobs = [{"tasks": pending[index::count]} for index in range(count)]
+            workdir, results = run_background_workers(context, "--janitor-lod-worker", jobs, len(pending))
+            failed = False
+            for job, shard, code, output in results:
+                done = {(entry["mesh"], entry["ratio"]) for entry in shard if "error" not in entry}
+                for task in job["tasks"]:
+                    if (task["mesh"], task["ratio"]) not in done:
+                        failed = True
+                        for key in [key for key, path in sources.items() if path == task["path"]]:
+                            del sources[key]
+                        self.report({'ERROR'}, "Failed to decimate {} (see {})".format(task["mesh"], output))
+            if not failed:
+                shutil.rmtree(workdir, ignore_errors=True)
+        else:
+            for task in pending:
+                lod = decimate_mesh(context, bpy.data.meshes[task["mesh"]], task["ratio"])
+                write_lod_cache(task["path"], lod)
+                sources[(task["mesh"], task["ratio"])] = lod
+
+        lods = {}
+        for (name, ratio), source in sources.items():
+            lod = read_lod_cache(source) if isinstance(source, str) else source
+            for index, material in enumerate(bpy.data.meshes[name].materials[:len(lod.materials)]):
+                lod.materials[index] = material
+            lods[(name, ratio)] = lod
+        return lods, cached
+
 
 #Split batch export
-class ExportSelectedObjectsOperator(bpy.types.Operator):
+class ExportSelectedObjectsOperator(JanitorJob, bpy.types.Operator):
     bl_idname = "object.export_selected_objects"
     bl_label = "Export Selected Objects"
 
     # Properties for file selection
     directory: bpy.props.StringProperty(subtype="DIR_PATH")
 
+    use_workers: bpy.props.BoolProperty(name="Background Workers", description="Export in parallel background Blender processes", default=False)
+    worker_count: bpy.props.IntProperty(name="Workers", description="Number of worker processes (0 = one per CPU core)", default=0, min=0)
+    use_cache: bpy.props.BoolProperty(name="Skip Unchanged", description="Skip objects whose content hash matches the last export", default=True)
+    formats: bpy.props.EnumProperty(name="Formats", items=EXPORT_FORMATS, default={'FBX'}, options={'ENUM_FLAG'})
+    include_lods: bpy.props.BoolProperty(name="Include LODs", description="Export the _LOD children of each object into its files", default=True)
+    generate_lods: bpy.props.BoolProperty(name="Generate LODs", description="Regenerate the LOD chain of every object before exporting", default=False)
+    lod_ratios: bpy.props.StringProperty(name="LOD Ratios", description="Comma separated decimate ratio of every LOD", default="0.5,0.25,0.125")
+
     def invoke(self, context, event):
         # Open the file dialog
         context.window_manager.fileselect_add(self)
         return {'RUNNING_MODAL'}
 
+    # collect -> validate -> transform -> write. The first three phases run once per
+    # export no matter how many formats are written.
+    @profiled
     def execute(self, context):
-        # Get the selected objects
-        selected_objects = bpy.context.selected_objects
-
         # Check if a directory has been selected
         if not self.directory:
             self.report({'ERROR'}, "No output directory selected!")
             return {'CANCELLED'}
+        if not self.formats:
+            self.report({'ERROR'}, "Select at least one export format.")
+            return {'CANCELLED'}
 
-        # Iterate through selected objects
-        for obj in selected_objects:
-            # Set the active object
-            bpy.context.view_layer.objects.active = obj
+        directory = bpy.path.abspath(self.directory)
+        formats = [export_format for export_format, name, description in EXPORT_FORMATS if export_format in self.formats]
 
-            # Select only the current object
-            bpy.ops.object.select_all(action='DESELECT')
-            obj.select_set(True)
+        if self.generate_lods:
+            result = bpy.ops.object.generate_lods(ratios=self.lod_ratios, use_workers=self.use_workers, worker_count=self.worker_count)
+            if 'FINISHED' not in result:
+                self.report({'ERROR'}, "LOD generation failed; nothing was exported.")
+                return {'CANCELLED'}
 
-            # Export the object to FBX
-            file_path = os.path.join(self.directory, obj.name + '.fbx')
-            bpy.ops.export_scene.fbx(filepath=file_path, use_selection=True)
+        # Collect and validate
+        selected_objects = collect_export_objects(context, self.include_lods)
+        problems = validate_export_objects(selected_objects)
+        invalid = {obj.name for obj, problem in problems}
+        selected_objects = [obj for obj in selected_objects if obj.name not in invalid]
+
+        # Transform: settings are resolved once and are part of the hash, so changing a
+        # preset or override re-exports. Objects with invalid overrides are logged as
+        # failed and skipped.
+        self.settings, self.settings_index, override_problems = resolve_export_settings(context.scene, selected_objects)
+        problems += override_problems
+        selected_objects = [obj for obj in selected_objects if obj.name in self.settings_index]
+        hashes = {}
+        for obj in selected_objects:
+            lods = lod_children(obj) if self.include_lods else []
+            salt = json.dumps(self.settings[self.settings_index[obj.name]], sort_keys=True)
+            hashes[obj.name] = object_content_hash(obj, salt + "".join(object_content_hash(lod) for lod in lods))
+
+        # Skip files whose hash matches the cache and that are still on disk; the cache
+        # is keyed per file, so every format is tracked on its own
+        cache = load_export_cache(directory) if self.use_cache else {}
+        pending = []
+        skipped = []
+        for obj in selected_objects:
+            stale = []
+            for export_format in formats:
+                path = os.path.join(directory, obj.name + EXPORT_WRITERS[export_format][0])
+                cached = cache.get(os.path.basename(path))
+                if cached and cached["hash"] == hashes[obj.name] and os.path.exists(path):
+                    skipped.append(dict(cached.get("record") or {"object": obj.name, "format": export_format, "file": path}, skipped=True))
+                else:
+                    stale.append(export_format)
+            if stale:
+                pending.append((obj.name, stale))
+
+        self.output_dir = directory
+        self.cache = cache
+        self.hashes = hashes
+        self.skipped = skipped
+
+        # The manifest lists every file of this run, unchanged ones first
+        self.manifest = ManifestWriter(os.path.join(directory, MANIFEST_NAME), truncate=True)
+        for record in skipped:
+            self.manifest.write(record)
+
+        # Write
+        self.entries = [{"object": obj.name, "error": problem} for obj, problem in problems]
+        if self.use_workers and len(pending) > 1 and background_workers_available(self):
+            return self.export_with_workers(context, pending, directory)
+
+        self.selection = _Selection(context)
+        return self.start_job(context, pending)
+
+    def job_step(self, context, tasks):
+        for name, formats in tasks:
+            obj = bpy.data.objects.get(name)
+            if obj is None:
+                self.entries.append({"object": name, "error": "Object was removed during the export"})
+                continue
+            settings = self.settings[self.settings_index[name]]
+            for entry in export_split_object(self.selection, obj, self.output_dir, formats, self.include_lods, settings):
+                if "error" not in entry:
+                    self.manifest.write(split_export_record(entry, self.include_lods, self.hashes[name]))
+                self.entries.append(entry)
+
+    # Runs after a full or cancelled export: only files that were written update the
+    # cache, so a cancelled run leaves a consistent manifest and log behind
+    def job_finish(self, context, cancelled):
+        if self.job_workers is not None:
+            self.entries.extend(self.worker_entries(cancelled))
+        else:
+            self.selection.restore()
+
+        self.manifest.close()
+        records = {record["file"]: record for record in _read_jsonl(self.manifest.path) if not record.get("skipped")}
+
+        entries = self.entries
+        for entry in entries:
+            if "error" not in entry:
+                self.cache[os.path.basename(entry["file"])] = {"hash": self.hashes[entry["object"]], "file": entry["file"],
+                                                               "record": records.get(entry["file"])}
+        save_export_cache(self.output_dir, self.cache)
+        if self.skipped:
+            self.report({'INFO'}, "Skipped {} unchanged files".format(len(self.skipped)))
+        entries.extend(self.skipped)
+
+        errors = [entry for entry in entries if "error" in entry]
+        for entry in errors:
+            self.report({'ERROR'}, "Failed to export {}: {}".format(entry["object"], entry["error"]))
+        log_path = write_export_log(self.output_dir, entries)
 
         # Display success message
-        self.report({'INFO'}, "Export successful!")
-        self.report({'INFO'}, "Files saved to: " + self.directory)
-
-        return {'FINISHED'}
-
-
-
-class OBJECT_OT_JoinMeshes(bpy.types.Operator):
+        if not errors and not cancelled:
+            self.report({'INFO'}, "Export successful!")
+        self.report({'INFO'}, "Files saved to: " + self.output_dir)
+        self.report({'INFO'}, "Export log: " + log_path)
+        self.report({'INFO'}, "Manifest: " + self.manifest.path)
+
+        return {'CANCELLED'} if cancelled else {'FINISHED'}
+
+    # Hand round-robin shards of the (object, formats) tasks to background Blender
+    # processes, polled from the job timer
+    def export_with_workers(self, context, tasks, directory):
+        count = min(self.worker_count or os.cpu_count() or 1, len(tasks))
+        jobs = []
+        for index in range(count):
+            shard = tasks[index::count]
+            names = [name for name, formats in shard]
+            jobs.append({"directory": directory, "objects": shard, "include_lods": self.include_lods,
+                         "manifest": self.manifest.path, "hashes": {name: self.hashes[name] for name in names},
+                         "settings": self.settings, "settings_index": {name: self.settings_index[name] for name in names}})
+        return self.start_worker_job(context, "--janitor-export-worker", jobs, sum(len(formats) for name, formats in tasks))
+
+    # Log entries of the finished workers; files a worker never reported get an error
+    def worker_entries(self, cancelled):
+        entries = []
+        for job, shard, code, output in self.job_results:
+            done = {(entry["object"], entry.get("format")) for entry in shard}
+            entries.extend(shard)
+            for name, formats in job["objects"]:
+                for export_format in formats:
+                    if (name, export_format) not in done and (name, None) not in done:
+                        error = "Cancelled" if cancelled else "Worker exited with code {} (see {})".format(code, output)
+                        entries.append({"object": name, "format": export_format, "error": error})
+
+        # Keep the worker output around when something went wrong
+        if not any("error" in entry for entry in entries):
+            shutil.rmtree(self.job_workdir, ignore_errors=True)
+        return entries
+
+
+
+class OBJECT_OT_JoinMeshes(JanitorJob, bpy.types.Operator):
     bl_idname = "object.join_meshes"
     bl_label = "Join Meshes"
+    bl_options = {'REGISTER', 'UNDO'}
 
+    group_by: bpy.props.EnumProperty(name="Group By", items=JOIN_GROUPINGS, default='NONE')
+
+    @profiled
     def execute(self, context):
-        selected_objects = bpy.context.selected_objects
+        selected_objects = [obj for obj in bpy.context.selected_objects if obj.type == 'MESH']
         if len(selected_objects) <= 1:
             self.report({'WARNING'}, "Select at least two objects to join")
             return {'CANCELLED'}
 
-        bpy.ops.object.select_all(action='DESELECT')
-        selected_objects[0].select_set(True)
-        bpy.context.view_layer.objects.active = selected_objects[0]
+        if context.mode != 'OBJECT':
+            bpy.ops.object.mode_set(mode='OBJECT')
 
-        for obj in selected_objects[1:]:
-            obj.select_set(True)
-            bpy.context.view_layer.objects.active = obj
-            bpy.ops.object.join()
+        self.object_count = len(selected_objects)
+        self.targets = []
+        self.joined = 0
+        self.selection = _Selection(context)
+        groups = group_objects(selected_objects, self.group_by)
+        return self.start_job(context, [[obj.name for obj in objects] for objects in groups.values()])
+
+    # One join call per group: the whole group is merged into its first object in a
+    # single linear pass instead of re-merging a growing mesh once per object
+    def job_step(self, context, groups):
+        for names in groups:
+            objects = [bpy.data.objects[name] for name in names if name in bpy.data.objects]
+            if not objects:
+                continue
+            target = objects[0]
+            if len(objects) > 1:
+                self.selection.select(objects)
+                bpy.ops.object.join()
+                self.joined += 1
+            self.targets.append(target.name)
+
+    # Groups joined before a cancel stay joined, the rest are left untouched. That
+    # partial result still finishes the operator so it gets its own undo step;
+    # only a cancel before the first join returns CANCELLED.
+    def job_finish(self, context, cancelled):
+        targets = [bpy.data.objects[name] for name in self.targets if name in bpy.data.objects]
+        self.selection.select(targets)
+
+        if len(targets) == 1 and not cancelled:
+            self.report({'INFO'}, "Joined {} objects into {}".format(self.object_count, targets[0].name))
+        else:
+            self.report({'INFO'}, "Joined {} objects into {} meshes".format(self.object_count, len(targets)))
+        if cancelled and self.joined:
+            self.report({'WARNING'}, "Stopped after joining {} groups; the remaining groups were left unjoined".format(self.joined))
+            return {'FINISHED'}
+        return {'CANCELLED'} if cancelled else {'FINISHED'}
 
-        self.report({'INFO'}, "Joined {} objects into {}".format(len(selected_objects), selected_objects[0].name))
-        return {'FINISHED'}
 
 
+# Axes TranslateVerticesOperator can move along
+TRANSLATE_AXES = [
+    ('X', "X", "Move along the X axis"),
+    ('Y', "Y", "Move along the Y axis"),
+    ('Z', "Z", "Move along the Z axis"),
+    ('NORMAL', "Normal", "Move every vertex along its own normal"),
+    ('CUSTOM', "Custom", "Move along the Custom Axis"),
+]
+
+
+def _snap(value, grid):
+    return round(value / grid) * grid
+
 
 #Define the custom operator for vertex translation
 class TranslateVerticesOperator(bpy.types.Operator):
     bl_idname = "mesh.translate_vertices"
     bl_label = "Translate"
+    bl_options = {'REGISTER', 'UNDO'}
     
-    direction: bpy.props.StringProperty(default='X')
-
+    direction: bpy.props.StringProperty(default='X', description="'X' moves forward along the axis, 'X_NEGATIVE' backwards")
+    step: bpy.props.FloatProperty(name="Step", default=0.5, subtype='DISTANCE')
+    axis: bpy.props.EnumProperty(name="Axis", items=TRANSLATE_AXES, default='X')
+    custom_axis: bpy.props.FloatVectorProperty(name="Custom Axis", default=(1.0, 0.0, 0.0), subtype='DIRECTION')
+    space: bpy.props.EnumProperty(name="Space", items=[
+        ('GLOBAL', "Global", "Step and axis are in world space"),
+        ('LOCAL', "Local", "Step and axis are in each object's local space"),
+    ], default='GLOBAL')
+    use_snap: bpy.props.BoolProperty(name="Snap to Grid", description="Round the moved coordinates to the grid", default=False)
+    grid: bpy.props.FloatProperty(name="Grid", default=0.1, min=0.0001, subtype='DISTANCE')
+
+    @profiled
     def execute(self, context):
     
         #Check if there is an active edit mode
-        if bpy.context.mode == 'EDIT_MESH':
+        if bpy.context.mode != 'EDIT_MESH':
+            self.report({'WARNING'}, "Precision Edit works in Edit Mode.")
+            return {'CANCELLED'}
 
-            #Translate the selected vertices along the specified axis
-            if self.direction == 'X':
-                bpy.ops.transform.translate(value=(0.5, 0, 0))
-            elif self.direction == 'X_NEGATIVE':
-                bpy.ops.transform.translate(value=(-0.5, 0, 0))
-                
+        distance = -self.step if self.direction.endswith('_NEGATIVE') else self.step
+        if self.axis in {'X', 'Y', 'Z'}:
+            axis = Vector((0.0, 0.0, 0.0))
+            axis['XYZ'.index(self.axis)] = 1.0
+        else:
+            axis = Vector(self.custom_axis).normalized()
+
+        # Move the selected vertices of every mesh in Edit Mode directly in its BMesh,
+        # without going through the interactive transform system
+        vertex_count = 0
+        for obj in context.objects_in_mode:
+            if obj.type != 'MESH':
+                continue
+            bm = bmesh.from_edit_mesh(obj.data)
+            verts = [vert for vert in bm.verts if vert.select]
+            if not verts:
+                continue
+            matrix = obj.matrix_world
+            world = self.space == 'GLOBAL'
+
+            if self.axis == 'NORMAL':
+                if world:
+                    normal_matrix = matrix.to_3x3().inverted().transposed()
+                    to_local = matrix.to_3x3().inverted()
+                    for vert in verts:
+                        vert.co += to_local @ ((normal_matrix @ vert.normal).normalized() * distance)
+                else:
+                    for vert in verts:
+                        vert.co += vert.normal * distance
+            elif world:
+                # bmesh.ops.translate with space=matrix_world moves in world space
+                bmesh.ops.translate(bm, vec=axis * distance, space=matrix, verts=verts)
+            else:
+                bmesh.ops.translate(bm, vec=axis * distance, verts=verts)
+
+            if self.use_snap:
+                # Snap only the moved component for X/Y/Z, all of them otherwise
+                components = ['XYZ'.index(self.axis)] if self.axis in {'X', 'Y', 'Z'} else [0, 1, 2]
+                inverse = matrix.inverted()
+                for vert in verts:
+                    co = matrix @ vert.co if world else vert.co.copy()
+                    for index in components:
+                        co[index] = _snap(co[index], self.grid)
+                    vert.co = inverse @ co if world else co
+
+            bmesh.update_edit_mesh(obj.data, loop_triangles=True, destructive=False)
+            vertex_count += len(verts)
+
+        self.report({'INFO'}, "Moved {} vertices".format(vertex_count))
         return {'FINISHED'}
 
 
 
+# Indices of the polygons with more than four sides, found with one foreach_get
+def ngon_indices(mesh):
+    loop_totals = np.empty(len(mesh.polygons), np.int32)
+    mesh.polygons.foreach_get("loop_total", loop_totals)
+    return np.flatnonzero(loop_totals > 4)
+
+
+# Shared by DeleteNGONS and triangulate_faces: find n-gons on every selected mesh in
+# Object Mode and delete or triangulate them in one bmesh session per mesh
+def run_ngon_tool(operator, context, action):
+    objects = list(context.selected_objects)
+    if context.active_object and context.active_object not in objects:
+        objects.append(context.active_object)
+    meshes = {obj.data for obj in objects if obj.type == 'MESH'}
+
+    if not meshes:
+        operator.report({'ERROR'}, "No mesh objects selected.")
+        return {'CANCELLED'}
+
+    if context.mode != 'OBJECT':
+        bpy.ops.object.mode_set(mode='OBJECT')
+
+    ngon_count = 0
+    mesh_count = 0
+    for mesh in meshes:
+        indices = ngon_indices(mesh)
+        if not len(indices):
+            continue
+        ngon_count += len(indices)
+        mesh_count += 1
+        if operator.dry_run:
+            continue
+
+        bm = bmesh.new()
+        bm.from_mesh(mesh)
+        bm.faces.ensure_lookup_table()
+        faces = [bm.faces[index] for index in indices]
+        if action == 'DELETE':
+            bmesh.ops.delete(bm, geom=faces, context='FACES')
+        else:
+            bmesh.ops.triangulate(bm, faces=faces, quad_method='BEAUTY', ngon_method='BEAUTY')
+        bm.to_mesh(mesh)
+        bm.free()
+        mesh.update()
+
+    if operator.dry_run:
+        operator.report({'INFO'}, "Found {} n-gons on {} of {} meshes".format(ngon_count, mesh_count, len(meshes)))
+    else:
+        verb = "Deleted" if action == 'DELETE' else "Triangulated"
+        operator.report({'INFO'}, "{} {} n-gons on {} of {} meshes".format(verb, ngon_count, mesh_count, len(meshes)))
+    return {'FINISHED'}
+
+
 class OBJECT_OT_DeleteNGONS(bpy.types.Operator):
     bl_idname = "object.delete_ngons"
     bl_label = "DeleteNGONS"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    dry_run: bpy.props.BoolProperty(name="Dry Run", description="Only count the n-gons", default=False, options={'SKIP_SAVE'})
     
+    @profiled
     def execute(self, context):
-        # Get the active object
-        obj = bpy.context.active_object
-
-        if obj and obj.type == 'MESH':
-            bpy.ops.object.mode_set(mode='EDIT')
-            bpy.ops.mesh.select_all(action='SELECT')
-            bpy.ops.mesh.select_face_by_sides(number=4, type='GREATER', extend=False)
-            bpy.ops.mesh.delete(type='FACE')
-            bpy.ops.object.mode_set(mode='OBJECT')
-        else:
-            self.report({'ERROR'}, "No active mesh object found.")
-        return {'FINISHED'}
+        return run_ngon_tool(self, context, 'DELETE')
     
     
 class OBJECT_OT_triangulate_faces(bpy.types.Operator):
     bl_idname = "object.triangulate_faces"
     bl_label = "Triangulate Faces"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    dry_run: bpy.props.BoolProperty(name="Dry Run", description="Only count the n-gons", default=False, options={'SKIP_SAVE'})
     
+    @profiled
     def execute(self, context):
-        obj = bpy.context.active_object
+        return run_ngon_tool(self, context, 'TRIANGULATE')
+
+
+# Wrapping multiply-xor hash of integer grid cells. Colliding cells only add candidate
+# pairs that the distance test rejects.
+def _cell_keys(cells):
+    return (cells[:, 0] * 73856093) ^ (cells[:, 1] * 19349663) ^ (cells[:, 2] * 83492791)
+
+
+# Pairs of vertices closer than `distance`. Coordinates are hashed into a grid of
+# `distance` sized cells, so only vertices in the same or neighbouring cells are compared.
+def close_vertex_pairs(coords, distance):
+    cells = np.floor(coords / distance).astype(np.int64)
+    keys = _cell_keys(cells)
+    order = np.argsort(keys, kind="stable")
+    cell_keys, starts, counts = np.unique(keys[order], return_index=True, return_counts=True)
+
+    firsts = []
+    seconds = []
+    for offset in itertools.product((-1, 0, 1), repeat=3):
+        # Half of the neighbours is enough to see every pair of cells once
+        if offset < (0, 0, 0):
+            continue
+        target = _cell_keys(cells + offset)
+        slots = np.minimum(np.searchsorted(cell_keys, target), len(cell_keys) - 1)
+        found = cell_keys[slots] == target
+        vertices = np.flatnonzero(found)
+        slots = slots[found]
+
+        # Every vertex against every vertex of its neighbour cell
+        sizes = counts[slots]
+        a = np.repeat(vertices, sizes)
+        runs = np.arange(sizes.sum()) - np.repeat(np.cumsum(sizes) - sizes, sizes)
+        b = order[np.repeat(starts[slots], sizes) + runs]
+        keep = a < b if offset == (0, 0, 0) else np.ones(len(a), bool)
+        delta = coords[a[keep]] - coords[b[keep]]
+        close = np.einsum("ij,ij->i", delta, delta) <= distance * distance
+        firsts.append(a[keep][close])
+        seconds.append(b[keep][close])
+    return np.concatenate(firsts), np.concatenate(seconds)
+
+
+# Lowest vertex index of every cluster of close vertices, by label propagation
+def merge_targets(count, firsts, seconds):
+    labels = np.arange(count)
+    while True:
+        low = np.minimum(labels[firsts], labels[seconds])
+        updated = labels.copy()
+        np.minimum.at(updated, firsts, low)
+        np.minimum.at(updated, seconds, low)
+        updated = updated[updated]
+        if np.array_equal(updated, labels):
+            return labels
+        labels = updated
+
+
+# Merges close vertices, dissolves zero-length edges and zero-area faces and deletes
+# loose vertices and edges on every selected mesh, in one bmesh session per mesh
+class OBJECT_OT_CleanupGeometry(bpy.types.Operator):
+    bl_idname = "object.cleanup_geometry"
+    bl_label = "Cleanup Geometry"
+    bl_description = "Merge by distance, dissolve degenerate geometry and delete loose vertices and edges"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    merge_distance: bpy.props.FloatProperty(name="Merge Distance", default=0.0001, min=1e-6, subtype='DISTANCE')
+    merge_vertices: bpy.props.BoolProperty(name="Merge Vertices", default=True)
+    dissolve_degenerate: bpy.props.BoolProperty(name="Dissolve Degenerate", description="Zero-length edges and zero-area faces", default=True)
+    delete_loose: bpy.props.BoolProperty(name="Delete Loose", description="Vertices without edges and edges without faces", default=True)
+    dry_run: bpy.props.BoolProperty(name="Dry Run", description="Only count the problems", default=False, options={'SKIP_SAVE'})
+
+    @profiled
+    def execute(self, context):
+        objects = list(context.selected_objects)
+        if context.active_object and context.active_object not in objects:
+            objects.append(context.active_object)
+        meshes = {obj.data for obj in objects if obj.type == 'MESH'}
 
-        if obj and obj.type == 'MESH':
-            bpy.ops.object.mode_set(mode='OBJECT')
-            bpy.ops.object.mode_set(mode='EDIT')
-            bpy.ops.mesh.select_all(action='DESELECT')
-            bpy.ops.mesh.select_face_by_sides(number=4, type='GREATER', extend=False)
-            bpy.ops.mesh.quads_convert_to_tris(quad_method='BEAUTY', ngon_method='BEAUTY')
+        if not meshes:
+            self.report({'ERROR'}, "No mesh objects selected.")
+            return {'CANCELLED'}
+
+        if context.mode != 'OBJECT':
             bpy.ops.object.mode_set(mode='OBJECT')
-        else:
-            self.report({'ERROR'}, "No active mesh object found.")
+
+        merged = degenerate = loose = 0
+        for mesh in meshes:
+            counts = self.cleanup_mesh(mesh)
+            merged += counts[0]
+            degenerate += counts[1]
+            loose += counts[2]
+
+        verb = "Found" if self.dry_run else "Cleaned"
+        self.report({'INFO'}, "{} {} duplicate vertices, {} degenerate edges/faces and {} loose elements on {} meshes".format(
+            verb, merged, degenerate, loose, len(meshes)))
         return {'FINISHED'}
 
+    # (merged vertices, degenerate edges and faces, loose vertices and edges) of one mesh.
+    # A dry run goes through the same bmesh steps and only skips writing the result back.
+    def cleanup_mesh(self, mesh):
+        targets = np.arange(len(mesh.vertices))
+        if self.merge_vertices and len(mesh.vertices):
+            coords = np.empty(len(mesh.vertices) * 3, np.float32)
+            mesh.vertices.foreach_get("co", coords)
+            targets = merge_targets(len(mesh.vertices), *close_vertex_pairs(coords.reshape(-1, 3).astype(np.float64), self.merge_distance))
+        sources = np.flatnonzero(targets != np.arange(len(mesh.vertices)))
+
+        if not len(sources) and not self.dissolve_degenerate and not self.delete_loose:
+            return 0, 0, 0
+
+        bm = bmesh.new()
+        bm.from_mesh(mesh)
+        bm.verts.ensure_lookup_table()
+        if len(sources):
+            bmesh.ops.weld_verts(bm, targetmap={bm.verts[index]: bm.verts[int(targets[index])] for index in sources.tolist()})
+
+        degenerate = 0
+        if self.dissolve_degenerate:
+            before = len(bm.edges) + len(bm.faces)
+            bmesh.ops.dissolve_degenerate(bm, dist=self.merge_distance, edges=bm.edges[:])
+            degenerate = before - len(bm.edges) - len(bm.faces)
+
+        # Loose elements are looked up after welding and dissolving: a connected vertex
+        # welded onto a stray duplicate keeps its edges and is not loose any more
+        loose = 0
+        if self.delete_loose:
+            before = len(bm.verts) + len(bm.edges)
+            loose_edges = [edge for edge in bm.edges if not edge.link_faces]
+            if loose_edges:
+                bmesh.ops.delete(bm, geom=loose_edges, context='EDGES')
+            loose_verts = [vert for vert in bm.verts if not vert.link_edges]
+            if loose_verts:
+                bmesh.ops.delete(bm, geom=loose_verts, context='VERTS')
+            loose = before - len(bm.verts) - len(bm.edges)
+
+        if not self.dry_run:
+            bm.to_mesh(mesh)
+            mesh.update()
+        bm.free()
+        return len(sources), degenerate, loose
+
+
+
+# Columns of the mesh audit table, in CSV order
+AUDIT_FIELDS = ["mesh", "objects", "tris", "quads", "ngons", "non_manifold_edges", "zero_area_faces",
+                "has_uvs", "unapplied_scale", "bad_materials"]
+
+# mesh_key -> (change stamp, geometry statistics)
+_audit_cache = {}
+
+# Totals of the last audit, shown in the panel
+_last_audit = {}
+
+
+# Geometry statistics for one mesh, from vectorized array reads
+def _mesh_geometry_stats(mesh):
+    loop_totals = np.empty(len(mesh.polygons), np.int32)
+    areas = np.empty(len(mesh.polygons), np.float32)
+    loop_edges = np.empty(len(mesh.loops), np.int32)
+    mesh.polygons.foreach_get("loop_total", loop_totals)
+    mesh.polygons.foreach_get("area", areas)
+    mesh.loops.foreach_get("edge_index", loop_edges)
+
+    sides = np.bincount(loop_totals, minlength=5)
+    edge_faces = np.bincount(loop_edges, minlength=len(mesh.edges))
+    return {
+        "tris": int(sides[3]),
+        "quads": int(sides[4]),
+        "ngons": int(sides[5:].sum()),
+        "non_manifold_edges": int(np.count_nonzero(edge_faces != 2)),
+        "zero_area_faces": int(np.count_nonzero(areas <= 1e-12)),
+    }
+
+
+# One row per mesh datablock. Geometry statistics are reused while the mesh's change
+# stamp is unchanged; names, UVs and object scale are cheap and always read fresh.
+def audit_meshes(meshes, users):
+    rows = []
+    recomputed = 0
+    for mesh in meshes:
+        stamp = mesh_change_stamp(mesh)
+        cached = _audit_cache.get(mesh_key(mesh))
+        if cached is None or cached[0] != stamp:
+            cached = (stamp, _mesh_geometry_stats(mesh))
+            _audit_cache[mesh_key(mesh)] = cached
+            recomputed += 1
+
+        objects = users.get(mesh.name_full, [])
+        row = {"mesh": mesh.name_full, "objects": [obj.name for obj in objects]}
+        row.update(cached[1])
+        row["has_uvs"] = len(mesh.uv_layers) > 0
+        row["unapplied_scale"] = [obj.name for obj in objects if any(abs(value - 1.0) > 1e-6 for value in obj.scale)]
+        row["bad_materials"] = sorted({mat.name for mat in mesh.materials if mat and not mat.name.startswith("M_")})
+        rows.append(row)
+    return rows, recomputed
+
+
+def audit_issue_count(row):
+    return (row["ngons"] + row["non_manifold_edges"] + row["zero_area_faces"] + (not row["has_uvs"])
+            + len(row["unapplied_scale"]) + len(row["bad_materials"]))
+
+
+def write_audit_report(filepath, rows):
+    if filepath.lower().endswith(".csv"):
+        with open(filepath, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=AUDIT_FIELDS)
+            writer.writeheader()
+            for row in rows:
+                writer.writerow({key: ";".join(value) if isinstance(value, list) else value for key, value in row.items()})
+    else:
+        with open(filepath, "w") as f:
+            json.dump({"meshes": rows, "issues": sum(audit_issue_count(row) for row in rows)}, f, indent=1)
+
+
+class OBJECT_OT_MeshAudit(bpy.types.Operator):
+    bl_idname = "object.mesh_audit"
+    bl_label = "Audit Meshes"
+    bl_description = "Collect geometry, UV, scale and material statistics for every mesh in the file"
+
+    filepath: bpy.props.StringProperty(name="Report", description="Optional .csv or .json file to write the table to", subtype='FILE_PATH', options={'SKIP_SAVE'})
+
+    @profiled
+    def execute(self, context):
+        # Edit-mode meshes only hold their last Object Mode state
+        for obj in context.objects_in_mode:
+            if obj.type == 'MESH':
+                obj.update_from_editmode()
+                _audit_cache.pop(mesh_key(obj.data), None)
+        prune_mesh_caches()
 
+        users = {}
+        for obj in bpy.data.objects:
+            if obj.type == 'MESH':
+                users.setdefault(obj.data.name_full, []).append(obj)
+
+        rows, recomputed = audit_meshes(bpy.data.meshes, users)
+
+        _last_audit.clear()
+        _last_audit["meshes"] = len(rows)
+        for field in ("tris", "quads", "ngons", "non_manifold_edges", "zero_area_faces"):
+            _last_audit[field] = sum(row[field] for row in rows)
+        _last_audit["without_uvs"] = sum(not row["has_uvs"] for row in rows)
+        _last_audit["unapplied_scale"] = sum(len(row["unapplied_scale"]) for row in rows)
+        _last_audit["bad_materials"] = len({name for row in rows for name in row["bad_materials"]})
+
+        if self.filepath:
+            write_audit_report(bpy.path.abspath(self.filepath), rows)
+            self.report({'INFO'}, "Audit report written to " + self.filepath)
+
+        issues = sum(audit_issue_count(row) for row in rows)
+        self.report({'INFO'}, "Audited {} meshes ({} recomputed), {} issues".format(len(rows), recomputed, issues))
+        return {'FINISHED'}
+
+
+# Runs the audit and writes the table to a file picked in the file browser; a .csv
+# name writes CSV, anything else JSON
+class OBJECT_OT_MeshAuditExport(bpy.types.Operator, ExportHelper):
+    bl_idname = "object.mesh_audit_export"
+    bl_label = "Export Audit Report"
+    bl_description = "Audit every mesh and write the table to a .csv or .json file"
+
+    filename_ext = ".json"
+    check_extension = None
+
+    filter_glob: StringProperty(default="*.json;*.csv", options={'HIDDEN'})
 
-class OBJECT_OT_InsetAndPoke(bpy.types.Operator):
-    bl_idname = "object.inset_and_poke"
-    bl_label = "Inset and Poke"
-    
     def execute(self, context):
-        obj = context.active_object
+        return bpy.ops.object.mesh_audit(filepath=self.filepath)
+
+
+class OBJECT_PT_MeshAudit(bpy.types.Panel):
+    bl_label = "Mesh Audit"
+    bl_idname = "PT_JanitorMeshAudit"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category = 'JanitorTools'
+    bl_parent_id = "PT_ScaleDisplay"
+    bl_options = {'DEFAULT_CLOSED'}
+
+    def draw(self, context):
+        layout = self.layout
+        row = layout.row(align=True)
+        row.operator("object.mesh_audit", text="Audit Meshes")
+        row.operator("object.mesh_audit_export", text="Export Report", icon='EXPORT')
 
-        if obj and obj.type == 'MESH':
-            selected_faces = [f for f in obj.data.polygons if f.select]
+        if _last_audit:
+            col = layout.column(align=True)
+            col.label(text="Meshes: {}".format(_last_audit["meshes"]))
+            col.label(text="Tris / Quads / NGONS: {} / {} / {}".format(_last_audit["tris"], _last_audit["quads"], _last_audit["ngons"]))
+            col.label(text="Non-manifold edges: {}".format(_last_audit["non_manifold_edges"]))
+            col.label(text="Zero-area faces: {}".format(_last_audit["zero_area_faces"]))
+            col.label(text="Meshes without UVs: {}".format(_last_audit["without_uvs"]))
+            col.label(text="Unapplied scale: {}".format(_last_audit["unapplied_scale"]))
+            col.label(text="Materials without M_: {}".format(_last_audit["bad_materials"]))
 
-            if selected_faces:
-                bpy.ops.mesh.inset(thickness=0.1)
-                bpy.ops.mesh.poke()
+
+
+# Per-operator summary of the profile history: runs, last/average/max time and last counters
+def profile_summary():
+    summary = {}
+    for record in _profile_history:
+        entry = summary.setdefault(record["operator"], {"runs": 0, "total": 0.0, "max": 0.0})
+        entry["runs"] += 1
+        entry["total"] += record["seconds"]
+        entry["max"] = max(entry["max"], record["seconds"])
+        entry["last"] = record
+    return summary
+
+
+class OBJECT_OT_ProfileDump(bpy.types.Operator, ExportHelper):
+    bl_idname = "object.janitor_profile_dump"
+    bl_label = "Dump Operator Profile"
+    bl_description = "Write the recorded JanitorTools operator timings to a JSON file"
+
+    filename_ext = ".json"
+
+    filter_glob: StringProperty(default="*.json", options={'HIDDEN'})
+
+    def execute(self, context):
+        with open(self.filepath, "w") as f:
+            json.dump({"runs": list(_profile_history), "summary": profile_summary()}, f, indent=1, default=str)
+        self.report({'INFO'}, "Wrote {} operator runs to {}".format(len(_profile_history), self.filepath))
+        return {'FINISHED'}
+
+
+class OBJECT_OT_ProfileClear(bpy.types.Operator):
+    bl_idname = "object.janitor_profile_clear"
+    bl_label = "Clear Operator Profile"
+
+    def execute(self, context):
+        _profile_history.clear()
+        return {'FINISHED'}
+
+
+class OBJECT_PT_JanitorProfiler(bpy.types.Panel):
+    bl_label = "Profiler"
+    bl_idname = "PT_JanitorProfiler"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category = 'JanitorTools'
+    bl_parent_id = "PT_ScaleDisplay"
+    bl_options = {'DEFAULT_CLOSED'}
+
+    def draw(self, context):
+        layout = self.layout
+        layout.prop(context.window_manager, "janitor_profile_memory")
+
+        summary = profile_summary()
+        if not summary:
+            layout.label(text="No operator runs recorded yet.")
+        for operator, entry in sorted(summary.items(), key=lambda item: -item[1]["total"]):
+            last = entry["last"]
+            box = layout.box()
+            box.label(text="{}  x{}".format(operator, entry["runs"]))
+            col = box.column(align=True)
+            col.label(text="Last {:.3f}s, avg {:.3f}s, max {:.3f}s".format(last["seconds"], entry["total"] / entry["runs"], entry["max"]))
+            if last.get("modal"):
+                col.label(text="Last run was modal (timing only)")
             else:
-                self.report({'ERROR'}, "No faces selected.")
+                memory = "{:.0f} KiB".format(last["peak_kib"]) if last["peak_kib"] is not None else "off"
+                col.label(text="bpy.ops {}, mode switches {}, peak {}".format(last["ops_calls"], last["mode_switches"], memory))
+
+        row = layout.row()
+        row.operator("object.janitor_profile_dump", text="Dump JSON")
+        row.operator("object.janitor_profile_clear", text="Clear")
+
+
+# Shared by InsetAndPoke and InsetAndTriangulate: inset the selected faces of every
+# mesh in multi-object Edit Mode (or every selected mesh in Object Mode), then poke or
+# triangulate the inset faces, all in one bmesh session per mesh
+def run_inset_tool(operator, context, action):
+    if context.mode == 'EDIT_MESH':
+        objects = [obj for obj in context.objects_in_mode if obj.type == 'MESH']
+    else:
+        objects = [obj for obj in context.selected_objects if obj.type == 'MESH']
+    if not objects:
+        operator.report({'ERROR'}, "No mesh object selected.")
+        return {'CANCELLED'}
+
+    face_count = 0
+    mesh_count = 0
+    for mesh in {obj.data for obj in objects}:
+        if mesh.is_editmode:
+            bm = bmesh.from_edit_mesh(mesh)
+            faces = [face for face in bm.faces if face.select]
+        else:
+            # Object Mode selection is current in the mesh arrays; skip meshes without
+            # selected faces before paying for a bmesh conversion
+            selected = np.empty(len(mesh.polygons), bool)
+            mesh.polygons.foreach_get("select", selected)
+            indices = np.flatnonzero(selected)
+            if not len(indices):
+                continue
+            bm = bmesh.new()
+            bm.from_mesh(mesh)
+            bm.faces.ensure_lookup_table()
+            faces = [bm.faces[index] for index in indices]
+
+        if faces:
+            bmesh.ops.inset_region(bm, faces=faces, thickness=operator.thickness, depth=operator.depth, use_even_offset=True)
+            if action == 'POKE':
+                bmesh.ops.poke(bm, faces=faces)
+            else:
+                bmesh.ops.triangulate(bm, faces=faces, quad_method='BEAUTY', ngon_method='BEAUTY')
+            face_count += len(faces)
+            mesh_count += 1
+
+        if mesh.is_editmode:
+            if faces:
+                bm.select_flush_mode()
+                bmesh.update_edit_mesh(mesh)
         else:
-            self.report({'ERROR'}, "No mesh object selected.")
+            bm.to_mesh(mesh)
+            bm.free()
+            mesh.update()
+
+    if not face_count:
+        operator.report({'ERROR'}, "No faces selected.")
+        return {'CANCELLED'}
 
-        return {'FINISHED'}   
+    operator.report({'INFO'}, "Inset {} faces on {} meshes".format(face_count, mesh_count))
+    return {'FINISHED'}
+
+
+class OBJECT_OT_InsetAndPoke(bpy.types.Operator):
+    bl_idname = "object.inset_and_poke"
+    bl_label = "Inset and Poke"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    thickness: bpy.props.FloatProperty(name="Thickness", default=0.1, min=0.0, subtype='DISTANCE')
+    depth: bpy.props.FloatProperty(name="Depth", default=0.0, subtype='DISTANCE')
+    
+    @profiled
+    def execute(self, context):
+        return run_inset_tool(self, context, 'POKE')
  
  
  
 class OBJECT_OT_InsetAndTriangulate(bpy.types.Operator):
     bl_idname = "object.inset_and_triangulate"
     bl_label = "Inset and Triangulate"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    thickness: bpy.props.FloatProperty(name="Thickness", default=0.1, min=0.0, subtype='DISTANCE')
+    depth: bpy.props.FloatProperty(name="Depth", default=0.0, subtype='DISTANCE')
     
+    @profiled
     def execute(self, context):
-        obj = context.active_object
+        return run_inset_tool(self, context, 'TRIANGULATE')
+    
+  
+# Edge adjacency of one mesh, built once from the raw arrays: edge -> verts,
+# vert -> edges (CSR), edge -> faces (first two plus a count) and face -> edges
+class MeshTopology:
+    def __init__(self, mesh):
+        edge_count = len(mesh.edges)
+        self.edge_verts = np.empty(edge_count * 2, np.int32)
+        mesh.edges.foreach_get("vertices", self.edge_verts)
+        self.edge_verts = self.edge_verts.reshape(-1, 2)
+        self.loop_edges = np.empty(len(mesh.loops), np.int32)
+        mesh.loops.foreach_get("edge_index", self.loop_edges)
+        self.face_starts = np.empty(len(mesh.polygons), np.int32)
+        self.face_sizes = np.empty(len(mesh.polygons), np.int32)
+        mesh.polygons.foreach_get("loop_start", self.face_starts)
+        mesh.polygons.foreach_get("loop_total", self.face_sizes)
+
+        # Vertex -> edges: edge ends sorted by vertex, sliced by the running valence
+        ends = self.edge_verts.ravel()
+        self.vert_edges = np.argsort(ends, kind="stable") // 2
+        self.vert_starts = np.concatenate(([0], np.cumsum(np.bincount(ends, minlength=len(mesh.vertices)))))
+
+        # Edge -> faces: loops sorted by edge. Two faces per edge are enough for loops,
+        # rings and dihedral angles; the count tells boundary and non-manifold edges apart
+        loop_faces = loop_polygon_indices(mesh)
+        order = np.argsort(self.loop_edges, kind="stable")
+        self.edge_face_count = np.bincount(self.loop_edges, minlength=edge_count)
+        first = np.concatenate(([0], np.cumsum(self.edge_face_count)[:-1]))
+        self.edge_faces = np.full((edge_count, 2), -1, np.int32)
+        for column in range(2):
+            has = self.edge_face_count > column
+            self.edge_faces[has, column] = loop_faces[order[first[has] + column]]
+
+    # True while the mesh still has the edges and faces this index was built from
+    def matches(self, mesh):
+        edge_verts = np.empty(self.edge_verts.size, np.int32)
+        loop_edges = np.empty(self.loop_edges.size, np.int32)
+        face_starts = np.empty(self.face_starts.size, np.int32)
+        mesh.edges.foreach_get("vertices", edge_verts)
+        mesh.loops.foreach_get("edge_index", loop_edges)
+        mesh.polygons.foreach_get("loop_start", face_starts)
+        return (np.array_equal(edge_verts, self.edge_verts.ravel()) and np.array_equal(loop_edges, self.loop_edges)
+                and np.array_equal(face_starts, self.face_starts))
+
+    def edges_of_vert(self, vert):
+        return self.vert_edges[self.vert_starts[vert]:self.vert_starts[vert + 1]]
+
+    def faces_of_edge(self, edge):
+        return [int(face) for face in self.edge_faces[edge] if face >= 0]
+
+    def edges_of_face(self, face):
+        start = self.face_starts[face]
+        return self.loop_edges[start:start + self.face_sizes[face]].tolist()
+
+    # Next edge of a loop through `vert`: the other boundary edge for boundary loops,
+    # otherwise the edge that shares no face with `edge` at a four-edge vertex
+    def _loop_step(self, edge, vert):
+        edges = self.edges_of_vert(vert)
+        if self.edge_face_count[edge] == 1:
+            others = [int(other) for other in edges if other != edge and self.edge_face_count[other] == 1]
+            return others[0] if len(others) == 1 else None
+        if len(edges) != 4 or self.edge_face_count[edge] != 2:
+            return None
+        faces = set(self.faces_of_edge(edge))
+        for other in edges:
+            if other != edge and not faces.intersection(self.faces_of_edge(other)):
+                return int(other)
+        return None
+
+    def edge_loop(self, edge):
+        edges = {edge}
+        for vert in self.edge_verts[edge].tolist():
+            current, pivot = edge, vert
+            while True:
+                current = self._loop_step(current, pivot)
+                if current is None or current in edges:
+                    break
+                edges.add(current)
+                a, b = self.edge_verts[current].tolist()
+                pivot = b if a == pivot else a
+        return edges
+
+    # Walks across quads to the opposite edge, in both directions from `edge`
+    def edge_ring(self, edge):
+        edges = {edge}
+        for face in self.faces_of_edge(edge):
+            current = edge
+            while face is not None and self.face_sizes[face] == 4:
+                sides = self.edges_of_face(face)
+                current = sides[(sides.index(current) + 2) % 4]
+                if current in edges:
+                    break
+                edges.add(current)
+                others = [other for other in self.faces_of_edge(current) if other != face]
+                face = others[0] if self.edge_face_count[current] == 2 else None
+        return edges
+
+
+# mesh_key -> (change stamp, MeshTopology)
+_topology_cache = {}
+
+
+# The cached topology of a mesh. Geometry updates that keep the edges and faces
+# (moved vertices, seam or sharp flags) only refresh the stamp.
+def mesh_topology(mesh):
+    stamp = mesh_change_stamp(mesh)
+    key = mesh_key(mesh)
+    cached = _topology_cache.get(key)
+    if cached is not None and cached[0] != stamp and cached[0][1:] == stamp[1:] and cached[1].matches(mesh):
+        cached = (stamp, cached[1])
+        _topology_cache[key] = cached
+    if cached is None or cached[0] != stamp:
+        cached = (stamp, MeshTopology(mesh))
+        _topology_cache[key] = cached
+    return cached[1]
+
+
+# Angle between the two faces of every edge from the polygon normals. Boundary edges
+# get 0 and edges with more than two faces get pi, so they always count as sharp.
+def edge_dihedral_angles(mesh, topology):
+    normals = np.empty(len(mesh.polygons) * 3, np.float32)
+    mesh.polygons.foreach_get("normal", normals)
+    normals = normals.reshape(-1, 3)
+
+    angles = np.zeros(len(topology.edge_faces))
+    paired = topology.edge_face_count >= 2
+    faces = topology.edge_faces[paired]
+    cosines = np.einsum("ij,ij->i", normals[faces[:, 0]], normals[faces[:, 1]])
+    angles[paired] = np.arccos(np.clip(cosines, -1.0, 1.0))
+    angles[topology.edge_face_count > 2] = math.pi
+    return angles
+
+
+SEAM_MODES = [
+    ('LOOP', "Loop", "Edge loops through the selected edges"),
+    ('RING', "Ring", "Edge rings through the selected edges"),
+    ('SHARP', "Sharp", "Every edge whose faces meet at more than the sharp angle"),
+]
+
+
+# Indices of the edges a seam operator works on, from the mesh's edge selection
+def seam_edge_indices(mesh, mode, sharp_angle):
+    topology = mesh_topology(mesh)
+    if mode == 'SHARP':
+        return np.flatnonzero(edge_dihedral_angles(mesh, topology) > sharp_angle)
+
+    selected = np.empty(len(mesh.edges), bool)
+    mesh.edges.foreach_get("select", selected)
+    walk = topology.edge_loop if mode == 'LOOP' else topology.edge_ring
+    edges = set()
+    for seed in np.flatnonzero(selected).tolist():
+        if seed not in edges:
+            edges |= walk(seed)
+    return np.fromiter(edges, np.int64, len(edges))
+
+
+# Shared by SelectAndMarkSeam and SelectAndClearSeam: find the loops, rings or sharp
+# edges of every mesh in multi-object Edit Mode (or every selected mesh in Object Mode)
+# and write their seam flags once per mesh
+def run_seam_tool(operator, context, mark):
+    if context.mode == 'EDIT_MESH':
+        objects = [obj for obj in context.objects_in_mode if obj.type == 'MESH']
+    else:
+        objects = [obj for obj in context.selected_objects if obj.type == 'MESH']
+    if not objects:
+        operator.report({'ERROR'}, "No mesh object selected.")
+        return {'CANCELLED'}
+
+    # Bring the edit-mode selection into the mesh arrays the topology is read from
+    for obj in objects:
+        if obj.mode == 'EDIT':
+            obj.update_from_editmode()
+    prune_mesh_caches()
+
+    edge_count = 0
+    mesh_count = 0
+    for mesh in {obj.data for obj in objects}:
+        indices = seam_edge_indices(mesh, operator.mode, operator.sharp_angle)
+        if not len(indices):
+            continue
+        edge_count += len(indices)
+        mesh_count += 1
+
+        if mesh.is_editmode:
+            # Edge indices match the edit-mesh order right after update_from_editmode
+            bm = bmesh.from_edit_mesh(mesh)
+            bm.edges.ensure_lookup_table()
+            for index in indices.tolist():
+                edge = bm.edges[index]
+                edge.seam = mark
+                edge.select_set(True)
+            bm.select_flush_mode()
+            bmesh.update_edit_mesh(mesh)
+        else:
+            seams = np.empty(len(mesh.edges), bool)
+            mesh.edges.foreach_get("use_seam", seams)
+            seams[indices] = mark
+            mesh.edges.foreach_set("use_seam", seams)
+            mesh.update()
 
-        if obj and obj.type == 'MESH':
-            selected_faces = [f for f in obj.data.polygons if f.select]
+    if not edge_count:
+        operator.report({'WARNING'}, "No edges found; select an edge of each loop or ring first.")
+        return {'CANCELLED'}
 
-            if selected_faces:
-                bpy.ops.mesh.inset(thickness=0.1)
-                bpy.ops.mesh.quads_convert_to_tris(quad_method='BEAUTY', ngon_method='BEAUTY')
-            else:
-                self.report({'ERROR'}, "No faces selected.")
-        else:
-            self.report({'ERROR'}, "No mesh object selected.")
+    verb = "Marked" if mark else "Cleared"
+    operator.report({'INFO'}, "{} seams on {} edges of {} meshes".format(verb, edge_count, mesh_count))
+    return {'FINISHED'}
 
-        return {'FINISHED'}
-    
-  
-  # Operator class to select an entire edge loop and mark it as seam
+
+# Operator class to select entire edge loops (or rings, or sharp edges) and mark them as seam
 class SelectAndMarkSeamOperator(bpy.types.Operator):
     bl_idname = "object.select_and_mark_seam"
     bl_label = "Select Edge Loop and Mark Seam"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    mode: bpy.props.EnumProperty(name="Mode", items=SEAM_MODES, default='LOOP')
+    sharp_angle: bpy.props.FloatProperty(name="Sharp Angle", default=math.radians(30.0), min=0.0, max=math.pi, subtype='ANGLE')
     
+    @profiled
     def execute(self, context):
-        # Get the active object and its mesh data
-        obj = context.active_object
-        if obj is None or obj.type != 'MESH':
-            self.report({'ERROR'}, "Active object is not a mesh or does not exist.")
-            return {'CANCELLED'}
-        
-        # Ensure we are in edit mode
-        bpy.ops.object.mode_set(mode='EDIT')
-        try:
-            bpy.ops.mesh.select_mode(type="EDGE")  # Change selection mode to edges
-            bpy.ops.mesh.loop_multi_select(ring=False)  # Select edge loop
-            bpy.ops.mesh.mark_seam()  # Mark selected edges as seam
-        except RuntimeError:
-            self.report({'ERROR'}, "Unable to select edge loop or mark seam.")
-            return {'CANCELLED'}
-
-        return {'FINISHED'}
+        return run_seam_tool(self, context, True)
 
     
           
-# Operator class to select an entire edge loop and mark it as seam
+# Operator class to select entire edge loops (or rings, or sharp edges) and clear their seams
 class SelectAndClearSeamOperator(bpy.types.Operator):
     bl_idname = "object.select_and_clear_seam"
     bl_label = "Select Edge Loop and Clear Seam"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    mode: bpy.props.EnumProperty(name="Mode", items=SEAM_MODES, default='LOOP')
+    sharp_angle: bpy.props.FloatProperty(name="Sharp Angle", default=math.radians(30.0), min=0.0, max=math.pi, subtype='ANGLE')
     
+    @profiled
     def execute(self, context):
-        # Get the active object and its mesh data
-        obj = context.active_object
-        if obj is None or obj.type != 'MESH':
-            self.report({'ERROR'}, "Active object is not a mesh or does not exist.")
-            return {'CANCELLED'}
-        
-        # Ensure we are in edit mode
-        bpy.ops.object.mode_set(mode='EDIT')
-        try:
-            bpy.ops.mesh.select_mode(type="EDGE")  # Change selection mode to edges
-            bpy.ops.mesh.loop_multi_select(ring=False)  # Select edge loop
-            bpy.ops.mesh.mark_seam(clear=True)  # Clear selected edges as seam
-        except RuntimeError:
-            self.report({'ERROR'}, "Unable to select edge loop or mark seam.")
+        return run_seam_tool(self, context, False)
+
+
+# Marks every edge whose faces meet at more than the angle as sharp and/or seam, on all
+# selected meshes, from vectorized dihedral angles and one attribute write per flag
+class OBJECT_OT_DetectFeatureEdges(bpy.types.Operator):
+    bl_idname = "object.detect_feature_edges"
+    bl_label = "Detect Feature Edges"
+    bl_description = "Mark sharp and/or seam edges by the angle between their faces"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    angle: bpy.props.FloatProperty(name="Angle", default=math.radians(30.0), min=0.0, max=math.pi, subtype='ANGLE')
+    mark_sharp: bpy.props.BoolProperty(name="Mark Sharp", default=True)
+    mark_seam: bpy.props.BoolProperty(name="Mark Seam", default=False)
+    replace: bpy.props.BoolProperty(name="Replace", description="Clear the flags on edges below the angle", default=True)
+    dry_run: bpy.props.BoolProperty(name="Dry Run", description="Only count the feature edges", default=False, options={'SKIP_SAVE'})
+
+    @profiled
+    def execute(self, context):
+        objects = list(context.selected_objects)
+        if context.active_object and context.active_object not in objects:
+            objects.append(context.active_object)
+        meshes = {obj.data for obj in objects if obj.type == 'MESH'}
+
+        if not meshes:
+            self.report({'ERROR'}, "No mesh objects selected.")
             return {'CANCELLED'}
 
+        if context.mode != 'OBJECT':
+            bpy.ops.object.mode_set(mode='OBJECT')
+
+        prune_mesh_caches()
+        attributes = [name for name, wanted in (("use_edge_sharp", self.mark_sharp), ("use_seam", self.mark_seam)) if wanted]
+        edge_count = 0
+        mesh_count = 0
+        for mesh in meshes:
+            features = edge_dihedral_angles(mesh, mesh_topology(mesh)) > self.angle
+            found = int(np.count_nonzero(features))
+            edge_count += found
+            mesh_count += found > 0
+            if self.dry_run:
+                continue
+
+            for attribute in attributes:
+                flags = features
+                if not self.replace:
+                    flags = np.empty(len(mesh.edges), bool)
+                    mesh.edges.foreach_get(attribute, flags)
+                    flags |= features
+                mesh.edges.foreach_set(attribute, flags)
+            if attributes:
+                mesh.update()
+
+        if self.dry_run or not attributes:
+            self.report({'INFO'}, "Found {} feature edges on {} of {} meshes".format(edge_count, mesh_count, len(meshes)))
+        else:
+            marked = " and ".join(name for name, wanted in (("sharp", self.mark_sharp), ("seam", self.mark_seam)) if wanted)
+            self.report({'INFO'}, "Marked {} feature edges {} on {} of {} meshes".format(edge_count, marked, mesh_count, len(meshes)))
         return {'FINISHED'}
 
 
@@ -551,6 +3008,13 @@ class SelectAndClearSeamOperator(bpy.types.Operator):
       
 # Register and unregister the panel and operators
 def register():
+    bpy.types.WindowManager.janitor_draw_timing = bpy.props.BoolProperty(
+        name="Time Panel Redraws", description="Measure how long the JanitorTools panel takes to draw", default=False)
+    bpy.types.WindowManager.janitor_profile_memory = bpy.props.BoolProperty(
+        name="Track Peak Memory", description="Trace Python allocations of JanitorTools operators (slows them down while enabled)", default=False)
+    bpy.utils.register_class(JanitorExportPreset)
+    bpy.types.Scene.janitor_export_presets = bpy.props.CollectionProperty(type=JanitorExportPreset)
+    bpy.types.Scene.janitor_export_preset_index = bpy.props.IntProperty(name="Export Preset", default=-1)
     bpy.utils.register_class(OBJECT_PT_ScaleDisplay)
     bpy.utils.register_class(OBJECT_OT_SmoothWeightsOperator)
     bpy.utils.register_class(OBJECT_OT_ToggleWireframe)
@@ -561,15 +3025,33 @@ def register():
     bpy.utils.register_class(OBJECT_OT_RenameSelected)
     bpy.utils.register_class(OBJECT_OT_BatchExportFBX)
     bpy.utils.register_class(ExportSelectedObjectsOperator)
+    bpy.utils.register_class(OBJECT_OT_GenerateLODs)
     bpy.utils.register_class(OBJECT_OT_JoinMeshes)
     bpy.utils.register_class(TranslateVerticesOperator)
     bpy.utils.register_class(OBJECT_OT_DeleteNGONS)
     bpy.utils.register_class(OBJECT_OT_triangulate_faces)
+    bpy.utils.register_class(OBJECT_OT_CleanupGeometry)
     bpy.utils.register_class(OBJECT_OT_InsetAndPoke)
     bpy.utils.register_class(OBJECT_OT_InsetAndTriangulate)
     bpy.utils.register_class(SelectAndMarkSeamOperator)
     bpy.utils.register_class(SelectAndClearSeamOperator)
+    bpy.utils.register_class(OBJECT_OT_DetectFeatureEdges)
+    bpy.utils.register_class(OBJECT_OT_MeshAudit)
+    bpy.utils.register_class(OBJECT_OT_MeshAuditExport)
+    bpy.utils.register_class(OBJECT_OT_FixNaming)
+    bpy.utils.register_class(OBJECT_OT_MergeDuplicateMaterials)
+    bpy.utils.register_class(OBJECT_OT_ProfileDump)
+    bpy.utils.register_class(OBJECT_OT_ProfileClear)
+    bpy.utils.register_class(OBJECT_PT_JanitorProfiler)
+    bpy.utils.register_class(OBJECT_PT_MeshAudit)
+    bpy.utils.register_class(OBJECT_OT_ExportPresetAdd)
+    bpy.utils.register_class(OBJECT_OT_ExportPresetRemove)
+    bpy.utils.register_class(OBJECT_UL_ExportPresets)
+    bpy.utils.register_class(OBJECT_PT_ExportPresets)
     #bpy.utils.register_class(QuickRotateUv90Pos)
+
+    bpy.app.handlers.depsgraph_update_post.append(_on_depsgraph_update)
+    bpy.app.handlers.load_post.append(_on_load_post)
     
 
 def unregister():
@@ -583,18 +3065,48 @@ def unregister():
     bpy.utils.unregister_class(OBJECT_OT_RenameSelected)
     bpy.utils.unregister_class(OBJECT_OT_BatchExportFBX)
     bpy.utils.unregister_class(ExportSelectedObjectsOperator)
+    bpy.utils.unregister_class(OBJECT_OT_GenerateLODs)
     bpy.utils.unregister_class(OBJECT_OT_JoinMeshes)
     bpy.utils.unregister_class(TranslateVerticesOperator)
     bpy.utils.unregister_class(OBJECT_OT_DeleteNGONS)
     bpy.utils.unregister_class(OBJECT_OT_triangulate_faces)
+    bpy.utils.unregister_class(OBJECT_OT_CleanupGeometry)
     bpy.utils.unregister_class(OBJECT_OT_InsetAndPoke)
     bpy.utils.unregister_class(OBJECT_OT_InsetAndTriangulate)
     bpy.utils.unregister_class(SelectAndMarkSeamOperator)
     bpy.utils.unregister_class(SelectAndClearSeamOperator)
+    bpy.utils.unregister_class(OBJECT_OT_DetectFeatureEdges)
+    bpy.utils.unregister_class(OBJECT_PT_MeshAudit)
+    bpy.utils.unregister_class(OBJECT_OT_MeshAuditExport)
+    bpy.utils.unregister_class(OBJECT_OT_MeshAudit)
+    bpy.utils.unregister_class(OBJECT_OT_FixNaming)
+    bpy.utils.unregister_class(OBJECT_OT_MergeDuplicateMaterials)
+    bpy.utils.unregister_class(OBJECT_PT_JanitorProfiler)
+    bpy.utils.unregister_class(OBJECT_OT_ProfileClear)
+    bpy.utils.unregister_class(OBJECT_OT_ProfileDump)
+    bpy.utils.unregister_class(OBJECT_PT_ExportPresets)
+    bpy.utils.unregister_class(OBJECT_UL_ExportPresets)
+    bpy.utils.unregister_class(OBJECT_OT_ExportPresetRemove)
+    bpy.utils.unregister_class(OBJECT_OT_ExportPresetAdd)
     #bpy.utils.unregister_class(QuickRotateUv90Pos)
+
+    if _on_depsgraph_update in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(_on_depsgraph_update)
+    if _on_load_post in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(_on_load_post)
+    del bpy.types.WindowManager.janitor_draw_timing
+    del bpy.types.WindowManager.janitor_profile_memory
+    del bpy.types.Scene.janitor_export_presets
+    del bpy.types.Scene.janitor_export_preset_index
+    bpy.utils.unregister_class(JanitorExportPreset)
     
 
 
 # Run the script
 if __name__ == "__main__":
-    register()
+    if "--janitor-export-worker" in sys.argv:
+        run_export_worker(sys.argv[sys.argv.index("--janitor-export-worker") + 1])
+    elif "--janitor-lod-worker" in sys.argv:
+        run_lod_worker(sys.argv[sys.argv.index("--janitor-lod-worker") + 1])
+    else:
+        register()
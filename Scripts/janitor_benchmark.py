@@ -0,0 +1,230 @@
+# Headless benchmarks for the JanitorTools operators on procedurally generated meshes.
+#
+#   blender -b --factory-startup --python janitor_benchmark.py -- --baseline bench.json
+#   blender -b --factory-startup --python janitor_benchmark.py -- --sizes 1000,100000 --baseline bench.json --update
+#
+# Every case builds a fresh scene, then times a single operator call. Results are
+# compared with the baseline JSON; cases slower than baseline * (1 + threshold)
+# are flagged and the script exits with code 1. --update rewrites the baseline.
+import argparse
+import json
+import math
+import os
+import sys
+import tempfile
+import time
+
+import bpy
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from janitor_cli import load_janitor_tools
+
+DEFAULT_SIZES = "1000,10000,100000,1000000,5000000"
+DEFAULT_OBJECTS = "100,1000"
+
+# Cases shorter than this are not reported as regressions; they are mostly noise
+MIN_REGRESSION_SECONDS = 0.01
+
+
+# Build a mesh from flat vertex coordinates, per-face vertex indices and face sizes
+def build_mesh(name, coords, face_vertices, face_sizes):
+    mesh = bpy.data.meshes.new(name)
+    mesh.vertices.add(len(coords) // 3)
+    mesh.vertices.foreach_set("co", coords.astype(np.float32))
+    mesh.loops.add(len(face_vertices))
+    mesh.loops.foreach_set("vertex_index", face_vertices.astype(np.int32))
+    mesh.polygons.add(len(face_sizes))
+    loop_starts = np.concatenate(([0], np.cumsum(face_sizes)[:-1])).astype(np.int32)
+    mesh.polygons.foreach_set("loop_start", loop_starts)
+    # Face sizes are derived from loop_start since Blender 4.0
+    try:
+        mesh.polygons.foreach_set("loop_total", face_sizes.astype(np.int32))
+    except (AttributeError, TypeError):
+        pass
+    mesh.update(calc_edges=True)
+    return mesh
+
+
+# Quad grid with at least `faces` faces
+def grid_mesh(faces):
+    side = max(1, int(math.ceil(math.sqrt(faces))))
+    xs, ys = np.meshgrid(np.arange(side + 1), np.arange(side + 1))
+    coords = np.stack([xs.ravel(), ys.ravel(), np.zeros(xs.size)], axis=1).ravel() / side
+
+    corner = (np.arange(side)[:, None] * (side + 1) + np.arange(side)[None, :]).ravel()
+    quads = np.stack([corner, corner + 1, corner + side + 2, corner + side + 1], axis=1).ravel()
+    return build_mesh("grid", coords, quads, np.full(side * side, 4))
+
+
+# Separate cylinders with 16-sided n-gon caps, enough of them for `faces` faces
+def capped_cylinders_mesh(faces, sides=16):
+    count = max(1, faces // (sides + 2))
+    angles = np.arange(sides) * (2.0 * math.pi / sides)
+    ring = np.stack([np.cos(angles), np.sin(angles), np.zeros(sides)], axis=1) * 0.4
+    cylinder = np.concatenate([ring, ring + (0.0, 0.0, 1.0)])
+
+    columns = int(math.ceil(math.sqrt(count)))
+    offsets = np.stack([np.arange(count) % columns, np.arange(count) // columns, np.zeros(count)], axis=1)
+    coords = (cylinder[None, :, :] + offsets[:, None, :]).ravel()
+
+    k = np.arange(sides)
+    side_quads = np.stack([k, (k + 1) % sides, (k + 1) % sides + sides, k + sides], axis=1).ravel()
+    caps = np.concatenate([k[::-1], k + sides])
+    template = np.concatenate([side_quads, caps])
+    face_vertices = (template[None, :] + (np.arange(count) * 2 * sides)[:, None]).ravel()
+    template_sizes = np.concatenate([np.full(sides, 4), [sides, sides]])
+    return build_mesh("cylinders", coords, face_vertices, np.tile(template_sizes, count))
+
+
+def reset_scene():
+    if bpy.context.object and bpy.context.object.mode != 'OBJECT':
+        bpy.ops.object.mode_set(mode='OBJECT')
+    for collection in (bpy.data.objects, bpy.data.meshes, bpy.data.materials):
+        for block in list(collection):
+            collection.remove(block)
+
+
+def add_objects(meshes, prefix="SM_Bench"):
+    objects = []
+    for index, mesh in enumerate(meshes):
+        obj = bpy.data.objects.new("{}_{:05d}".format(prefix, index), mesh)
+        bpy.context.scene.collection.objects.link(obj)
+        obj.select_set(True)
+        objects.append(obj)
+    bpy.context.view_layer.objects.active = objects[0]
+    return objects
+
+
+def many_objects_scene(count):
+    material = bpy.data.materials.new("M_Bench")
+    meshes = []
+    for _ in range(count):
+        mesh = grid_mesh(16)
+        mesh.materials.append(material)
+        meshes.append(mesh)
+    objects = add_objects(meshes)
+    for index, obj in enumerate(objects):
+        obj.location = (index % 32, index // 32, 0.0)
+    return objects
+
+
+def seam_scene(faces):
+    obj = add_objects([grid_mesh(faces)])[0]
+    obj.data.edges[0].select = True
+    bpy.ops.object.mode_set(mode='EDIT')
+    bpy.ops.mesh.select_mode(type='EDGE')
+    return obj
+
+
+# (case name, scene setup, operator call) for every size
+def benchmark_cases(sizes, object_counts, output_dir):
+    cases = []
+    for faces in sizes:
+        cases += [
+            ("smooth_weights[grid-{}]".format(faces), lambda f=faces: add_objects([grid_mesh(f)]), lambda: bpy.ops.object.smooth_weights()),
+            ("delete_ngons[cylinders-{}]".format(faces), lambda f=faces: add_objects([capped_cylinders_mesh(f)]), lambda: bpy.ops.object.delete_ngons()),
+            ("triangulate_faces[cylinders-{}]".format(faces), lambda f=faces: add_objects([capped_cylinders_mesh(f)]), lambda: bpy.ops.object.triangulate_faces()),
+            ("cleanup_geometry[cylinders-{}]".format(faces), lambda f=faces: add_objects([capped_cylinders_mesh(f)]), lambda: bpy.ops.object.cleanup_geometry()),
+            ("select_and_mark_seam[grid-{}]".format(faces), lambda f=faces: seam_scene(f), lambda: bpy.ops.object.select_and_mark_seam()),
+            ("select_and_clear_seam[grid-{}]".format(faces), lambda f=faces: seam_scene(f), lambda: bpy.ops.object.select_and_clear_seam()),
+            ("select_and_mark_seam[sharp-cylinders-{}]".format(faces), lambda f=faces: add_objects([capped_cylinders_mesh(f)]),
+             lambda: bpy.ops.object.select_and_mark_seam(mode='SHARP')),
+            ("detect_feature_edges[cylinders-{}]".format(faces), lambda f=faces: add_objects([capped_cylinders_mesh(f)]),
+             lambda: bpy.ops.object.detect_feature_edges(mark_seam=True)),
+        ]
+    for count in object_counts:
+        fbx_path = os.path.join(output_dir, "batch_{}.fbx".format(count))
+        split_dir = os.path.join(output_dir, "split_{}".format(count))
+        os.makedirs(split_dir, exist_ok=True)
+        cases += [
+            ("join_meshes[objects-{}]".format(count), lambda c=count: many_objects_scene(c), lambda: bpy.ops.object.join_meshes()),
+            ("batch_export_fbx[objects-{}]".format(count), lambda c=count: many_objects_scene(c),
+             lambda p=fbx_path: bpy.ops.object.batch_export_fbx(filepath=p)),
+            ("export_selected_objects[objects-{}]".format(count), lambda c=count: many_objects_scene(c),
+             lambda d=split_dir: bpy.ops.object.export_selected_objects(directory=d, use_cache=False)),
+        ]
+    return cases
+
+
+def run_cases(cases, repeat):
+    results = {}
+    for name, setup, call in cases:
+        timings = []
+        for _ in range(repeat):
+            reset_scene()
+            setup()
+            start = time.perf_counter()
+            call()
+            timings.append(time.perf_counter() - start)
+        results[name] = min(timings)
+        print("{:<48} {:>10.4f}s".format(name, results[name]))
+    reset_scene()
+    return results
+
+
+# Cases slower than baseline * (1 + threshold), as (name, baseline, current)
+def find_regressions(results, baseline, threshold):
+    regressions = []
+    for name, seconds in sorted(results.items()):
+        previous = baseline.get(name)
+        if previous is None:
+            continue
+        if seconds > previous * (1.0 + threshold) and seconds - previous > MIN_REGRESSION_SECONDS:
+            regressions.append((name, previous, seconds))
+    return regressions
+
+
+def parse_args(argv):
+    argv = argv[argv.index("--") + 1:] if "--" in argv else []
+    parser = argparse.ArgumentParser(prog="janitor_benchmark.py", description="Benchmark the JanitorTools operators")
+    parser.add_argument("--sizes", default=DEFAULT_SIZES, help="Comma separated face counts for the mesh cases")
+    parser.add_argument("--objects", default=DEFAULT_OBJECTS, help="Comma separated object counts for the join/export cases")
+    parser.add_argument("--only", default="", help="Only run cases whose name contains one of these comma separated words")
+    parser.add_argument("--repeat", type=int, default=1, help="Run every case N times and keep the fastest")
+    parser.add_argument("--baseline", help="Baseline JSON to compare with")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Allowed slowdown before a case is flagged (0.2 = 20%%)")
+    parser.add_argument("--update", action="store_true", help="Write the results to --baseline instead of comparing")
+    parser.add_argument("--output", help="Also write the results to this JSON file")
+    return parser.parse_args(argv)
+
+
+def main():
+    args = parse_args(sys.argv)
+    load_janitor_tools()
+    # Allocation tracing would be timed along with the operators
+    bpy.context.window_manager.janitor_profile_memory = False
+
+    sizes = [int(value) for value in args.sizes.split(",") if value]
+    object_counts = [int(value) for value in args.objects.split(",") if value]
+    with tempfile.TemporaryDirectory(prefix="janitor_bench_") as output_dir:
+        cases = benchmark_cases(sizes, object_counts, output_dir)
+        if args.only:
+            words = args.only.split(",")
+            cases = [case for case in cases if any(word in case[0] for word in words)]
+        results = run_cases(cases, max(1, args.repeat))
+
+    report = {"blender": bpy.app.version_string, "results": results}
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=1, sort_keys=True)
+
+    if not args.baseline:
+        return 0
+    if args.update or not os.path.exists(args.baseline):
+        with open(args.baseline, "w") as f:
+            json.dump(report, f, indent=1, sort_keys=True)
+        print("Baseline written to " + args.baseline)
+        return 0
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)["results"]
+    regressions = find_regressions(results, baseline, args.threshold)
+    for name, previous, seconds in regressions:
+        print("REGRESSION {:<40} {:.4f}s -> {:.4f}s (+{:.0%})".format(name, previous, seconds, seconds / previous - 1.0))
+    print("{} cases, {} regressions".format(len(results), len(regressions)))
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
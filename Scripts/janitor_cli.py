@@ -0,0 +1,210 @@
+# Headless batch runner for the JanitorTools operators.
+#
+# Run a pipeline on the file Blender was started with:
+#   blender -b file.blend --python janitor_cli.py -- smooth_weights,delete_ngons
+#
+# Run a pipeline over many files, one background Blender process per file:
+#   blender -b --python janitor_cli.py -- cleanup,delete_ngons,freeze_transforms,export "assets/**/*.blend" --output exports --jobs 8
+#
+# Steps run in the order given. Pass --save to write the cleaned files back.
+import argparse
+import glob
+import importlib.util
+import json
+import os
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import bpy
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+# Import the add-on script that matches this Blender version and register its operators
+def load_janitor_tools():
+    if bpy.app.version >= (4, 1, 0):
+        name = "JanitorToolsV1.5 (Blender 4.1).py"
+    else:
+        name = "JanitorToolsV1.5.py"
+    spec = importlib.util.spec_from_file_location("janitor_tools", os.path.join(HERE, name))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    module.register()
+    return module
+
+
+def _select_only(context, objects):
+    for obj in context.selected_objects:
+        obj.select_set(False)
+    for obj in objects:
+        obj.select_set(True)
+    context.view_layer.objects.active = objects[0] if objects else None
+
+
+# Every step runs once on the whole selection and returns the operator result
+def _all_at_once(operator):
+    def step(context, meshes, args):
+        _select_only(context, meshes)
+        return operator()
+    return step
+
+
+def _file_stem():
+    return os.path.splitext(os.path.basename(bpy.data.filepath))[0] or "untitled"
+
+
+def _export(context, meshes, args):
+    if not args.output:
+        raise SystemExit("The export step needs --output")
+    directory = os.path.join(os.path.abspath(args.output), _file_stem())
+    os.makedirs(directory, exist_ok=True)
+    _select_only(context, meshes)
+    result = bpy.ops.object.export_selected_objects(directory=directory, formats=set(args.formats))
+    if 'FINISHED' not in result:
+        return result
+
+    # The operator finishes even when single files fail; those are in its log
+    with open(os.path.join(directory, "janitor_export_log.jsonl")) as f:
+        errors = [entry for entry in map(json.loads, f) if "error" in entry]
+    for entry in errors:
+        print("JanitorTools:     {} failed: {}".format(entry.get("file") or entry["object"], entry["error"]))
+    return {'CANCELLED'} if errors else result
+
+
+# Writes <output>/<file name>_audit.json when --output is given, so CI can gate on it
+def _audit(context, meshes, args):
+    filepath = ""
+    if args.output:
+        os.makedirs(args.output, exist_ok=True)
+        filepath = os.path.join(os.path.abspath(args.output), _file_stem() + "_audit.json")
+    return bpy.ops.object.mesh_audit(filepath=filepath)
+
+
+PIPELINE_STEPS = {
+    "smooth_weights": _all_at_once(lambda: bpy.ops.object.smooth_weights()),
+    "delete_ngons": _all_at_once(lambda: bpy.ops.object.delete_ngons()),
+    "triangulate_faces": _all_at_once(lambda: bpy.ops.object.triangulate_faces()),
+    "cleanup": _all_at_once(lambda: bpy.ops.object.cleanup_geometry()),
+    "freeze_transforms": _all_at_once(lambda: bpy.ops.object.freeze_transforms()),
+    "lods": _all_at_once(lambda: bpy.ops.object.generate_lods()),
+    "audit": _audit,
+    "export": _export,
+}
+
+
+# Formats of the add-on's split export (EXPORT_FORMATS)
+EXPORT_FORMATS = ("FBX", "GLB", "OBJ")
+
+
+def parse_args(argv):
+    argv = argv[argv.index("--") + 1:] if "--" in argv else []
+    parser = argparse.ArgumentParser(prog="janitor_cli.py", description="Run JanitorTools operators on .blend files")
+    parser.add_argument("steps", help="Comma separated steps: " + ", ".join(PIPELINE_STEPS))
+    parser.add_argument("files", nargs="*", help="Glob patterns of .blend files (default: the file Blender was started with)")
+    parser.add_argument("--output", help="Directory for the export step")
+    parser.add_argument("--formats", default="FBX", help="Comma separated formats of the export step: " + ", ".join(EXPORT_FORMATS))
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1, help="Number of Blender processes to run in parallel")
+    parser.add_argument("--save", action="store_true", help="Save each file after running the pipeline")
+    args = parser.parse_args(argv)
+
+    args.steps = [step.strip() for step in args.steps.split(",") if step.strip()]
+    unknown = [step for step in args.steps if step not in PIPELINE_STEPS]
+    if unknown:
+        parser.error("Unknown step(s): " + ", ".join(unknown))
+    args.formats = [value.strip().upper() for value in args.formats.split(",") if value.strip()]
+    unknown = [value for value in args.formats if value not in EXPORT_FORMATS]
+    if unknown or not args.formats:
+        parser.error("Unknown format(s): {} (choose from {})".format(", ".join(unknown) or "none given", ", ".join(EXPORT_FORMATS)))
+    return args
+
+
+def expand_files(patterns):
+    files = set()
+    for pattern in patterns:
+        files.update(glob.glob(pattern, recursive=True))
+    return sorted(os.path.abspath(path) for path in files if path.endswith(".blend"))
+
+
+# Run every step on the file that is currently loaded. Stops at the first step that
+# fails (without saving) and returns False.
+def run_pipeline(args):
+    context = bpy.context
+    if context.object and context.object.mode != 'OBJECT':
+        bpy.ops.object.mode_set(mode='OBJECT')
+    meshes = [obj for obj in context.view_layer.objects if obj.type == 'MESH' and obj.visible_get()]
+    print("JanitorTools: {} ({} meshes)".format(bpy.data.filepath or "<unsaved>", len(meshes)))
+    if not meshes:
+        return True
+
+    for name in args.steps:
+        print("JanitorTools:   " + name)
+        try:
+            result = PIPELINE_STEPS[name](context, meshes, args)
+        except RuntimeError as error:
+            # Operators that report an error raise in background mode
+            print("JanitorTools:   {} failed: {}".format(name, error))
+            return False
+        if 'FINISHED' not in result:
+            print("JanitorTools:   {} failed ({})".format(name, ", ".join(sorted(result))))
+            return False
+        # Steps such as joins can remove objects; keep only the live ones
+        meshes = [obj for obj in meshes if obj.name in context.view_layer.objects]
+
+    if args.save and bpy.data.filepath:
+        bpy.ops.wm.save_mainfile()
+    return True
+
+
+# Hand each file to its own background Blender process, args.jobs at a time
+def run_pool(args, files):
+    def run(path):
+        command = [bpy.app.binary_path, "--background", "--factory-startup", path,
+                   "--python-exit-code", "1", "--python", os.path.abspath(__file__), "--", ",".join(args.steps), "--jobs", "1"]
+        if args.output:
+            command += ["--output", os.path.abspath(args.output)]
+        command += ["--formats", ",".join(args.formats)]
+        if args.save:
+            command.append("--save")
+        result = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, universal_newlines=True)
+        return path, result.returncode, result.stdout
+
+    failed = []
+    with ThreadPoolExecutor(max_workers=max(1, args.jobs)) as pool:
+        for path, code, output in pool.map(run, files):
+            print("==> {} (exit code {})".format(path, code))
+            print(output)
+            if code != 0:
+                failed.append(path)
+
+    print("JanitorTools: processed {} files, {} failed".format(len(files), len(failed)))
+    for path in failed:
+        print("  FAILED " + path)
+    return 1 if failed else 0
+
+
+def main():
+    args = parse_args(sys.argv)
+    files = expand_files(args.files)
+    if args.files and not files:
+        print("JanitorTools: no .blend files matched")
+        return 1
+
+    if len(files) > 1 and args.jobs > 1:
+        return run_pool(args, files)
+
+    load_janitor_tools()
+    if not files:
+        return 0 if run_pipeline(args) else 1
+    failed = []
+    for path in files:
+        bpy.ops.wm.open_mainfile(filepath=path)
+        if not run_pipeline(args):
+            failed.append(path)
+    for path in failed:
+        print("  FAILED " + path)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())